@@ -1,26 +1,23 @@
 """Utility functions and CLI argument parsing for jolo."""
 
 import argparse
+import base64
 import contextlib
 import fcntl
+import functools
 import json
 import os
 import random
-import re
 import socket
 import subprocess
 import sys
 from pathlib import Path
 
-try:
-    import argcomplete
-except ImportError:
-    pass
-
-import base64
-
 from _jolo import constants
 
+if constants.HAVE_ARGCOMPLETE:
+    import argcomplete
+
 
 def clipboard_copy(text: str) -> None:
     """Copy text to the system clipboard via OSC 52 escape sequence."""
@@ -339,8 +336,13 @@ def verbose_cmd(cmd: list[str]) -> None:
         print(f"[verbose] $ {' '.join(cmd)}", file=sys.stderr)
 
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
-    """Parse command-line arguments."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the top-level jolo argument parser with all subcommands.
+
+    Built once per process and shared: argparse keeps no per-parse state
+    on the parser, so callers must not modify it.
+    """
     # --- Reusable parent parsers (no help to avoid duplicate -h) ---
     # Each groups related flags so subcommands pick only what they need.
 
@@ -762,6 +764,13 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         help="List projects with cross-container podman access enabled",
     )
 
+    return parser
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = _build_parser()
+
     if constants.HAVE_ARGCOMPLETE:
         argcomplete.autocomplete(parser)
 
@@ -805,9 +814,21 @@ def generate_random_name() -> str:
     return f"{adj}-{noun}"
 
 
+# Byte table for slugify_prompt: a-z and 0-9 map to themselves, every
+# other byte (including the "?" that stands in for non-ASCII) to "-"
+_SLUG_TABLE = bytes(
+    c if c in b"abcdefghijklmnopqrstuvwxyz0123456789" else ord("-")
+    for c in range(256)
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def slugify_prompt(prompt: str, max_len: int = 50) -> str:
     """Convert a research prompt to a filename slug."""
-    slug = re.sub(r"[^a-z0-9]+", "-", prompt.lower()).strip("-")
+    # translate + split avoids the regex engine; empty parts are the
+    # runs of separators and the leading/trailing ones
+    mapped = prompt.lower().encode("ascii", "replace").translate(_SLUG_TABLE)
+    slug = "-".join(filter(None, mapped.decode("ascii").split("-")))
     if len(slug) > max_len:
         slug = slug[:max_len].rsplit("-", 1)[0]
     return slug or "research"
@@ -8,6 +8,8 @@ import shlex
 import shutil
 import subprocess
 import sys
+from collections.abc import Callable
+from datetime import datetime, timezone
 from pathlib import Path
 
 import tomllib
@@ -71,6 +73,7 @@ from _jolo.setup import (
     sync_devcontainer,
     sync_skill_templates,
     sync_template_files,
+    write_json,
     write_prompt_file,
 )
 from _jolo.templates import (
@@ -1820,7 +1823,7 @@ def run_spawn_mode(args: argparse.Namespace) -> None:
             if "containerEnv" not in content:
                 content["containerEnv"] = {}
             content["containerEnv"]["PORT"] = str(port)
-            devcontainer_json.write_text(json.dumps(content, indent=4) + "\n")
+            write_json(devcontainer_json, content, indent=4)
 
         # Add user-specified mounts
         if args.mount:
@@ -1984,8 +1987,17 @@ def spawn_tmux_multipane(
     subprocess.run(["tmux", "attach", "-t", session_name])
 
 
-def ensure_research_repo(config: dict) -> Path:
-    """Ensure the research repo exists, creating it on first use."""
+def ensure_research_repo(
+    config: dict,
+    *,
+    runner: Callable[..., subprocess.CompletedProcess] | None = None,
+) -> Path:
+    """Ensure the research repo exists, creating it on first use.
+
+    runner stands in for subprocess.run on the git calls.
+    """
+    if runner is None:
+        runner = subprocess.run
     research_home = Path(
         config.get("research_home", "~/jolo/research")
     ).expanduser()
@@ -1998,7 +2010,7 @@ def ensure_research_repo(config: dict) -> Path:
         shutil.rmtree(research_home)
 
     research_home.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=research_home, check=True)
+    runner(["git", "init"], cwd=research_home, check=True)
     scaffold_devcontainer("research", research_home, config=config)
 
     # Copy just the research skill
@@ -2009,8 +2021,8 @@ def ensure_research_repo(config: dict) -> Path:
         skill_dst.parent.mkdir(parents=True, exist_ok=True)
         shutil.copytree(skill_src, skill_dst)
 
-    subprocess.run(["git", "add", "."], cwd=research_home, check=True)
-    subprocess.run(
+    runner(["git", "add", "."], cwd=research_home, check=True)
+    runner(
         ["git", "commit", "-m", "Initial research repo"],
         cwd=research_home,
         check=True,
@@ -2019,10 +2031,20 @@ def ensure_research_repo(config: dict) -> Path:
     return research_home
 
 
-def _resolve_research_prompt(args: argparse.Namespace) -> str:
-    """Resolve the research prompt from args, file, or $EDITOR."""
+def _resolve_research_prompt(
+    args: argparse.Namespace,
+    *,
+    runner: Callable[..., subprocess.CompletedProcess] | None = None,
+) -> str:
+    """Resolve the research prompt from args, file, or $EDITOR.
+
+    runner stands in for subprocess.run when launching the editor.
+    """
     import tempfile
 
+    if runner is None:
+        runner = subprocess.run
+
     if args.file:
         path = Path(args.file).expanduser()
         if not path.exists():
@@ -2045,7 +2067,7 @@ def _resolve_research_prompt(args: argparse.Namespace) -> str:
 
     try:
         # Shell=True so EDITOR="emacsclient -w" works
-        result = subprocess.run(f"{editor} {shlex.quote(tmppath)}", shell=True)
+        result = runner(f"{editor} {shlex.quote(tmppath)}", shell=True)
         if result.returncode != 0:
             sys.exit("Editor exited with error")
         text = Path(tmppath).read_text()
@@ -2070,17 +2092,27 @@ def _build_research_agent_cmd(
     return f"nohup {agent_cmd} -p {quoted_prompt} > {logfile} 2>&1 &"
 
 
-def run_research_mode(args: argparse.Namespace) -> None:
-    """Run research in a persistent container at ~/jolo/research/."""
-    from datetime import datetime, timezone
+def run_research_mode(
+    args: argparse.Namespace,
+    *,
+    research_home: Path | None = None,
+    now: datetime | None = None,
+) -> None:
+    """Run research in a persistent container at ~/jolo/research/.
 
+    research_home skips locating (and creating) the research repo; now
+    fixes the timestamp in the output filenames.
+    """
     prompt = _resolve_research_prompt(args)
 
     config = load_config()
-    research_home = ensure_research_repo(config)
+    if research_home is None:
+        research_home = ensure_research_repo(config)
 
     slug = slugify_prompt(prompt)
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%d-%H%M")
+    if now is None:
+        now = datetime.now(timezone.utc)
+    ts = now.strftime("%Y-%m-%d-%H%M")
 
     _setup_container_env(research_home, config)
     if not is_container_running(research_home):
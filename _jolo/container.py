@@ -507,7 +507,10 @@ def find_containers_for_project(
     if runtime is None:
         return []
 
-    project_name = git_root.name
+    # String paths, normalized so trailing slashes etc. still match: the
+    # project itself, or a worktree directly under ../PROJECT-worktrees/
+    project_dir = os.path.normpath(git_root)
+    worktrees_dir = f"{project_dir}-worktrees"
 
     # Get all containers (including stopped) with devcontainer label
     all_containers = list_all_devcontainers()
@@ -515,14 +518,14 @@ def find_containers_for_project(
     # Filter to containers that match this project
     matched = []
     for name, folder, state, image_id in all_containers:
-        # Check if folder is under this project or its worktrees
-        folder_path = Path(folder)
+        if state_filter is not None and state != state_filter:
+            continue
+        folder_path = os.path.normpath(folder)
         if (
-            folder_path == git_root
-            or folder_path.parent.name == f"{project_name}-worktrees"
+            folder_path == project_dir
+            or os.path.dirname(folder_path) == worktrees_dir
         ):
-            if state_filter is None or state == state_filter:
-                matched.append((name, folder, state, image_id))
+            matched.append((name, folder, state, image_id))
 
     return matched
 
@@ -61,9 +61,11 @@ def clear_directory_contents(path: Path) -> None:
 
     This preserves the directory inode, which is important for bind mounts.
     """
-    if not path.exists():
+    try:
+        items = list(path.iterdir())
+    except FileNotFoundError:
         return
-    for item in path.iterdir():
+    for item in items:
         if item.is_dir():
             shutil.rmtree(item)
         else:
@@ -203,10 +205,8 @@ def setup_credential_cache(
 
     # Claude credentials
     claude_cache = workspace_dir / ".devcontainer" / ".claude-cache"
-    if claude_cache.exists():
-        clear_directory_contents(claude_cache)
-    else:
-        claude_cache.mkdir(parents=True)
+    claude_cache.mkdir(parents=True, exist_ok=True)
+    clear_directory_contents(claude_cache)
 
     # .credentials.json is mounted RW directly from the host (token refreshes persist).
     # Only copy settings.json (we inject notification hooks into it).
@@ -273,10 +273,8 @@ def setup_credential_cache(
         ):
             shutil.copy2(cache_token, store_token)
 
-    if gemini_cache.exists():
-        clear_directory_contents(gemini_cache)
-    else:
-        gemini_cache.mkdir(parents=True)
+    gemini_cache.mkdir(parents=True, exist_ok=True)
+    clear_directory_contents(gemini_cache)
     agy_dir.mkdir(parents=True, exist_ok=True)
 
     gemini_dir = home / ".gemini"
@@ -363,10 +361,8 @@ def setup_credential_cache(
 
     # Codex credentials
     codex_cache = workspace_dir / ".devcontainer" / ".codex-cache"
-    if codex_cache.exists():
-        clear_directory_contents(codex_cache)
-    else:
-        codex_cache.mkdir(parents=True)
+    codex_cache.mkdir(parents=True, exist_ok=True)
+    clear_directory_contents(codex_cache)
 
     codex_dir = home / ".codex"
     for filename in ["config.toml", "auth.json"]:
@@ -431,10 +427,8 @@ def setup_credential_cache(
 
     # Pi credentials
     pi_cache = workspace_dir / ".devcontainer" / ".pi-cache"
-    if pi_cache.exists():
-        clear_directory_contents(pi_cache)
-    else:
-        pi_cache.mkdir(parents=True)
+    pi_cache.mkdir(parents=True, exist_ok=True)
+    clear_directory_contents(pi_cache)
 
     pi_dir = home / ".pi"
     if pi_dir.exists():
@@ -13,7 +13,11 @@ from _jolo.cli import (
     verbose_cmd,
 )
 from _jolo.container import replace_port_args
-from _jolo.setup import add_worktree_git_mount, scaffold_devcontainer
+from _jolo.setup import (
+    add_worktree_git_mount,
+    scaffold_devcontainer,
+    write_json,
+)
 
 
 def get_worktree_path(project_path: str, worktree_name: str) -> Path:
@@ -233,7 +237,7 @@ def get_or_create_worktree(
         content["containerEnv"]["PORT"] = str(new_port)
         # Update workspaceFolder to match worktree name
         content["workspaceFolder"] = f"/workspaces/{worktree_name}"
-        devcontainer_json.write_text(json.dumps(content, indent=4) + "\n")
+        write_json(devcontainer_json, content, indent=4)
 
     # Add mount for main repo's .git directory so worktree git operations work
     main_git_dir = git_root / ".git"
@@ -160,7 +160,7 @@ class TestGetAutonomousItems(unittest.TestCase):
     """Emacsclient-backed selection returns parsed items."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         os.chdir(self.tmpdir)
         (Path(self.tmpdir) / "docs").mkdir()
@@ -168,9 +168,6 @@ class TestGetAutonomousItems(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_invokes_emacsclient_with_select_function(self):
         with mock.patch("_jolo.autonomous.subprocess.run") as mock_run:
@@ -270,7 +267,7 @@ class TestRunAutonomousIntegration(unittest.TestCase):
     """End-to-end orchestrator (mocked emacsclient + subprocess)."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         os.chdir(self.tmpdir)
         (Path(self.tmpdir) / ".git").mkdir()
@@ -279,9 +276,6 @@ class TestRunAutonomousIntegration(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def _make_args(self, **overrides):
         import argparse
@@ -465,7 +459,7 @@ class TestRunAutonomousSurfacesEmacsClientError(unittest.TestCase):
     """Setup errors (daemon down, helper missing) must fail loud."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         os.chdir(self.tmpdir)
         (Path(self.tmpdir) / ".git").mkdir()
@@ -474,9 +468,6 @@ class TestRunAutonomousSurfacesEmacsClientError(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def _make_args(self):
         import argparse
@@ -503,7 +494,7 @@ class TestRunAutonomousLoadsConfigFromGitRoot(unittest.TestCase):
     """`.jolo.toml` at the repo root must be honored when run from subdirs."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         root = Path(self.tmpdir)
         (root / ".git").mkdir()
@@ -515,9 +506,6 @@ class TestRunAutonomousLoadsConfigFromGitRoot(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def _make_args(self):
         import argparse
@@ -573,7 +561,7 @@ class TestRunAutonomousFromSubdir(unittest.TestCase):
     """`jolo autonomous` run from a subdirectory resolves to the git root."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         root = Path(self.tmpdir)
         (root / ".git").mkdir()
@@ -584,9 +572,6 @@ class TestRunAutonomousFromSubdir(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def _make_args(self, **overrides):
         import argparse
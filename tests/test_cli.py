@@ -8,6 +8,11 @@ from pathlib import Path
 from unittest import mock
 
 import jolo
+from _jolo.cli import _build_parser
+
+# Built once for the flag-level tests; TestArgumentParsing keeps going
+# through jolo.parse_args to cover the public wrapper
+_PARSER = _build_parser()
 
 
 class TestArgumentParsing(unittest.TestCase):
@@ -19,6 +24,11 @@ class TestArgumentParsing(unittest.TestCase):
         self.assertIsNone(args.command)
         self.assertFalse(args.recreate)
 
+    def test_parse_args_reuses_parser(self):
+        """parse_args should build the parser once per process."""
+        first = jolo.parse_args([])._parser
+        self.assertIs(jolo.parse_args(["tree"])._parser, first)
+
     def test_help_flag(self):
         """--help should exit with usage info."""
         with self.assertRaises(SystemExit) as cm:
@@ -105,14 +115,11 @@ class TestGitDetection(unittest.TestCase):
     """Test git repository detection."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_find_git_root_at_root(self):
         """Should find git root when at repo root."""
@@ -189,12 +196,12 @@ class TestVerboseMode(unittest.TestCase):
 
     def test_verbose_flag(self):
         """--verbose should set verbose to True."""
-        args = jolo.parse_args(["up", "--verbose"])
+        args = _PARSER.parse_args(["up", "--verbose"])
         self.assertTrue(args.verbose)
 
     def test_verbose_short_flag(self):
         """-v should set verbose to True."""
-        args = jolo.parse_args(["up", "-v"])
+        args = _PARSER.parse_args(["up", "-v"])
         self.assertTrue(args.verbose)
 
 
@@ -203,18 +210,18 @@ class TestSpawnArgParsing(unittest.TestCase):
 
     def test_spawn_flag(self):
         """spawn should accept integer."""
-        args = jolo.parse_args(["spawn", "5"])
+        args = _PARSER.parse_args(["spawn", "5"])
         self.assertEqual(args.count, 5)
 
     def test_spawn_with_prefix(self):
         """spawn can be combined with --prefix."""
-        args = jolo.parse_args(["spawn", "3", "--prefix", "feat"])
+        args = _PARSER.parse_args(["spawn", "3", "--prefix", "feat"])
         self.assertEqual(args.count, 3)
         self.assertEqual(args.prefix, "feat")
 
     def test_spawn_with_prompt(self):
         """spawn can be combined with --prompt."""
-        args = jolo.parse_args(["spawn", "5", "-p", "do stuff"])
+        args = _PARSER.parse_args(["spawn", "5", "-p", "do stuff"])
         self.assertEqual(args.count, 5)
         self.assertEqual(args.prompt, "do stuff")
 
@@ -409,17 +416,19 @@ class TestMountArgParsing(unittest.TestCase):
 
     def test_mount_flag_single(self):
         """--mount should accept source:target."""
-        args = jolo.parse_args(["up", "--mount", "~/data:data"])
+        args = _PARSER.parse_args(["up", "--mount", "~/data:data"])
         self.assertEqual(args.mount, ["~/data:data"])
 
     def test_mount_flag_multiple(self):
         """--mount can be specified multiple times."""
-        args = jolo.parse_args(["up", "--mount", "~/a:a", "--mount", "~/b:b"])
+        args = _PARSER.parse_args(
+            ["up", "--mount", "~/a:a", "--mount", "~/b:b"]
+        )
         self.assertEqual(args.mount, ["~/a:a", "~/b:b"])
 
     def test_mount_readonly(self):
         """--mount should accept :ro suffix."""
-        args = jolo.parse_args(["up", "--mount", "~/data:data:ro"])
+        args = _PARSER.parse_args(["up", "--mount", "~/data:data:ro"])
         self.assertEqual(args.mount, ["~/data:data:ro"])
 
 
@@ -428,19 +437,21 @@ class TestCopyArgParsing(unittest.TestCase):
 
     def test_copy_flag_single(self):
         """--copy should accept source:target."""
-        args = jolo.parse_args(["up", "--copy", "~/config.json:config.json"])
+        args = _PARSER.parse_args(
+            ["up", "--copy", "~/config.json:config.json"]
+        )
         self.assertEqual(args.copy, ["~/config.json:config.json"])
 
     def test_copy_flag_multiple(self):
         """--copy can be specified multiple times."""
-        args = jolo.parse_args(
+        args = _PARSER.parse_args(
             ["up", "--copy", "~/a.json", "--copy", "~/b.json:b.json"]
         )
         self.assertEqual(args.copy, ["~/a.json", "~/b.json:b.json"])
 
     def test_copy_without_target(self):
         """--copy should accept source without target."""
-        args = jolo.parse_args(["up", "--copy", "~/config.json"])
+        args = _PARSER.parse_args(["up", "--copy", "~/config.json"])
         self.assertEqual(args.copy, ["~/config.json"])
 
 
@@ -449,7 +460,7 @@ class TestMountAndCopyTogether(unittest.TestCase):
 
     def test_mount_and_copy_combined(self):
         """--mount and --copy can be used together."""
-        args = jolo.parse_args(
+        args = _PARSER.parse_args(
             [
                 "up",
                 "--mount",
@@ -553,19 +564,19 @@ class TestFlavorArgParsing(unittest.TestCase):
 
     def test_flavor_flag_single(self):
         """--flavor should accept a single flavor."""
-        args = jolo.parse_args(["create", "test", "--flavor", "python-web"])
+        args = _PARSER.parse_args(["create", "test", "--flavor", "python-web"])
         self.assertEqual(args.flavor, ["python-web"])
 
     def test_flavor_flag_comma_separated(self):
         """--flavor should accept comma-separated values."""
-        args = jolo.parse_args(
+        args = _PARSER.parse_args(
             ["create", "test", "--flavor", "python-web,typescript"]
         )
         self.assertEqual(args.flavor, ["python-web", "typescript"])
 
     def test_flavor_flag_multiple_values(self):
         """--flavor should handle multiple comma-separated values."""
-        args = jolo.parse_args(
+        args = _PARSER.parse_args(
             ["create", "test", "--flavor", "python,go-web,rust"]
         )
         self.assertEqual(args.flavor, ["python", "go-web", "rust"])
@@ -573,24 +584,26 @@ class TestFlavorArgParsing(unittest.TestCase):
     def test_flavor_valid_values(self):
         """--flavor should accept all valid flavor values."""
         for flav in sorted(jolo.VALID_FLAVORS):
-            args = jolo.parse_args(["create", "test", "--flavor", flav])
+            args = _PARSER.parse_args(["create", "test", "--flavor", flav])
             self.assertEqual(args.flavor, [flav])
 
     def test_flavor_invalid_value_raises_error(self):
         """--flavor should reject invalid values."""
         with self.assertRaises(SystemExit):
-            jolo.parse_args(["create", "test", "--flavor", "invalid_flavor"])
+            _PARSER.parse_args(
+                ["create", "test", "--flavor", "invalid_flavor"]
+            )
 
     def test_flavor_mixed_valid_invalid_raises_error(self):
         """--flavor should reject if any value is invalid."""
         with self.assertRaises(SystemExit):
-            jolo.parse_args(
+            _PARSER.parse_args(
                 ["create", "test", "--flavor", "python-web,invalid"]
             )
 
     def test_flavor_with_create(self):
         """--flavor can combine with create."""
-        args = jolo.parse_args(
+        args = _PARSER.parse_args(
             ["create", "myproject", "--flavor", "python-web,typescript"]
         )
         self.assertEqual(args.name, "myproject")
@@ -598,7 +611,7 @@ class TestFlavorArgParsing(unittest.TestCase):
 
     def test_flavor_whitespace_handling(self):
         """--flavor should handle values with whitespace around commas."""
-        args = jolo.parse_args(
+        args = _PARSER.parse_args(
             [
                 "create",
                 "test",
@@ -613,7 +626,7 @@ class TestExecArgParsing(unittest.TestCase):
     """Test exec subcommand argument parsing."""
 
     def test_exec_command_parsed(self):
-        args = jolo.parse_args(["exec", "pnpm", "run", "dev"])
+        args = _PARSER.parse_args(["exec", "pnpm", "run", "dev"])
         self.assertEqual(args.command, "exec")
         self.assertEqual(args.exec_command, ["pnpm", "run", "dev"])
 
@@ -622,12 +635,7 @@ class TestDetectFlavors(unittest.TestCase):
     """Test auto-flavor detection from project files."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
 
     def test_detects_python_bare(self):
         Path(self.tmpdir, "pyproject.toml").touch()
@@ -14,14 +14,11 @@ class TestConfigLoading(unittest.TestCase):
     """Test TOML configuration loading."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_load_config_returns_defaults_when_no_files(self):
         """Should return default config when no config files exist."""
@@ -112,7 +109,7 @@ class TestPodmanAllowance(unittest.TestCase):
     survives across recreates."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.config_dir = Path(self.tmpdir)
         # Patch socat for the whole suite — these tests aren't about
         # whether socat works, they're about the gate-dir state machine.
@@ -129,9 +126,6 @@ class TestPodmanAllowance(unittest.TestCase):
     def tearDown(self):
         for p in self._socat_patches:
             p.stop()
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_disallowed_by_default(self):
         """Without an allow, the gate dir doesn't exist."""
@@ -183,14 +177,9 @@ class TestPodmanProxyLifecycle(unittest.TestCase):
         self._dir = _podman_runtime_dir
         self._sock = _podman_proxy_socket
         self._pidfile = _podman_proxy_pidfile
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.config_dir = Path(self.tmpdir)
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_paths_are_keyed_by_project(self):
         """Per-project gate dir contains the sentinel + socket + pidfile."""
         d = self._dir("foo", self.config_dir)
@@ -289,14 +278,9 @@ class TestPodmanAllowRollback(unittest.TestCase):
     (including the `jolo up --recreate` hint)."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.config_dir = Path(self.tmpdir)
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_first_allow_rolls_back_on_socat_failure(self):
         from _jolo.cli import _podman_runtime_dir
 
@@ -346,15 +330,10 @@ class TestPodmanWiring(unittest.TestCase):
     would silently disable the feature for --recreate flows."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project_path = Path(self.tmpdir) / "myproj"
         self.project_path.mkdir()
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def _run_with_allowed(self, allowed: bool):
         with (
             mock.patch(
@@ -563,15 +542,12 @@ class TestCloneMode(unittest.TestCase):
     """Test clone functionality."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         os.chdir(self.tmpdir)
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_infer_repo_name(self):
         """Should infer repo name from common URL formats."""
@@ -626,7 +602,7 @@ class TestExecMode(unittest.TestCase):
     """Test exec command behavior."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         self.git_root = Path(self.tmpdir) / "myproject"
         self.git_root.mkdir()
@@ -635,9 +611,6 @@ class TestExecMode(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     @mock.patch("_jolo.commands.devcontainer_exec_command")
     def test_exec_calls_devcontainer_exec(self, mock_exec):
@@ -682,7 +655,7 @@ class TestRunPortMode(unittest.TestCase):
     """Test run_port_mode command handler."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         self.ws = Path(self.tmpdir) / "project"
         self.ws.mkdir()
@@ -692,9 +665,6 @@ class TestRunPortMode(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def _write_config(self, config):
         import json
@@ -787,102 +757,6 @@ class TestRunPortMode(unittest.TestCase):
         self.assertEqual(config["containerEnv"]["PORT"], "4200")
 
 
-class TestSetPort(unittest.TestCase):
-    """Test set_port function."""
-
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.ws = Path(self.tmpdir) / "project"
-        self.ws.mkdir()
-        (self.ws / ".devcontainer").mkdir()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
-    def _write_config(self, config):
-        import json
-
-        path = self.ws / ".devcontainer" / "devcontainer.json"
-        path.write_text(json.dumps(config, indent=4) + "\n")
-
-    def _read_config(self):
-        import json
-
-        path = self.ws / ".devcontainer" / "devcontainer.json"
-        return json.loads(path.read_text())
-
-    def test_set_port_updates_env(self):
-        """Should update PORT in containerEnv."""
-        self._write_config(
-            {
-                "containerEnv": {"PORT": "4500"},
-                "runArgs": ["-p", "4500:4500"],
-            }
-        )
-
-        from _jolo.container import set_port
-
-        set_port(self.ws, 4200)
-        config = self._read_config()
-        self.assertEqual(config["containerEnv"]["PORT"], "4200")
-
-    def test_set_port_updates_run_args(self):
-        """Should update -p flag in runArgs."""
-        self._write_config(
-            {
-                "containerEnv": {"PORT": "4500"},
-                "runArgs": ["--name", "myapp", "-p", "4500:4500"],
-            }
-        )
-
-        from _jolo.container import set_port
-
-        set_port(self.ws, 4200)
-        config = self._read_config()
-        self.assertIn("4200:4200", config["runArgs"])
-        self.assertNotIn("4500:4500", config["runArgs"])
-
-    def test_set_port_errors_without_devcontainer(self):
-        """Should exit if devcontainer.json doesn't exist."""
-        ws = Path(self.tmpdir) / "empty"
-        ws.mkdir()
-        (ws / ".devcontainer").mkdir()
-
-        from _jolo.container import set_port
-
-        with self.assertRaises(SystemExit):
-            set_port(ws, 4200)
-
-    def test_set_port_creates_container_env_if_missing(self):
-        """Should create containerEnv if not present."""
-        self._write_config({"runArgs": ["-p", "4500:4500"]})
-
-        from _jolo.container import set_port
-
-        set_port(self.ws, 4200)
-        config = self._read_config()
-        self.assertEqual(config["containerEnv"]["PORT"], "4200")
-
-    def test_set_port_leaves_other_args_unchanged(self):
-        """Should only update PORT and -p flag, not other runArgs."""
-        self._write_config(
-            {
-                "containerEnv": {"PORT": "4500"},
-                "runArgs": ["--name", "myapp", "-p", "4500:4500"],
-            }
-        )
-
-        from _jolo.container import set_port
-
-        set_port(self.ws, 4200)
-        config = self._read_config()
-        self.assertEqual(config["containerEnv"]["PORT"], "4200")
-        self.assertIn("--name", config["runArgs"])
-        self.assertIn("myapp", config["runArgs"])
-
-
 class TestFmtSize(unittest.TestCase):
     """Test _fmt_size helper."""
 
@@ -966,14 +840,15 @@ class TestSetupContainerEnvCreatesSkills(unittest.TestCase):
     setup so the recreate path isn't the only one that lands skills."""
 
     def setUp(self):
-        self.tmpdir = Path(tempfile.mkdtemp())
+        self.tmpdir = Path(
+            self.enterContext(
+                tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+            )
+        )
         self.original_cwd = Path.cwd()
 
     def tearDown(self):
-        import shutil
-
         os.chdir(self.original_cwd)
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     @mock.patch("_jolo.commands.setup_stash")
     @mock.patch("_jolo.commands.setup_emacs_config")
@@ -15,14 +15,11 @@ class TestSyncDevcontainer(unittest.TestCase):
     """Test --sync functionality."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_sync_overwrites_existing_devcontainer(self):
         """--sync should regenerate .devcontainer even if it exists."""
@@ -208,309 +205,411 @@ class TestContainerRuntime(unittest.TestCase):
 class TestListAllDevcontainers(unittest.TestCase):
     """Test global devcontainer listing."""
 
-    def test_list_all_returns_empty_without_runtime(self):
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value=None,
+    )
+    def test_list_all_returns_empty_without_runtime(self, _runtime):
         """Should return empty list if no container runtime."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value=None
-        ):
-            result = jolo.list_all_devcontainers()
-            self.assertEqual(result, [])
-
-    def test_list_all_parses_docker_output(self):
+        result = jolo.list_all_devcontainers()
+        self.assertEqual(result, [])
+
+    @mock.patch(
+        "subprocess.run",
+        autospec=True,
+        return_value=mock.Mock(
+            returncode=0,
+            stdout="mycontainer\t/home/user/project\trunning\timg123\n",
+        ),
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_list_all_parses_docker_output(self, *_):
         """Should parse docker ps output correctly."""
-        mock_output = "mycontainer\t/home/user/project\trunning\timg123\n"
-        with mock.patch("jolo.get_container_runtime", return_value="docker"):
-            with mock.patch("subprocess.run") as mock_run:
-                mock_run.return_value = mock.Mock(
-                    returncode=0, stdout=mock_output
-                )
-                result = jolo.list_all_devcontainers()
-                self.assertEqual(len(result), 1)
-                self.assertEqual(
-                    result[0],
-                    ("mycontainer", "/home/user/project", "running", "img123"),
-                )
+        result = jolo.list_all_devcontainers()
+        self.assertEqual(len(result), 1)
+        self.assertEqual(
+            result[0],
+            ("mycontainer", "/home/user/project", "running", "img123"),
+        )
 
 
 class TestGetContainerForWorkspace(unittest.TestCase):
     """Test container lookup by workspace."""
 
-    def test_returns_none_without_runtime(self):
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value=None,
+    )
+    def test_returns_none_without_runtime(self, _runtime):
         """Should return None if no container runtime."""
-        with mock.patch("jolo.get_container_runtime", return_value=None):
-            result = jolo.get_container_for_workspace(Path("/some/path"))
-            self.assertIsNone(result)
-
-    def test_returns_container_name(self):
+        result = jolo.get_container_for_workspace(Path("/some/path"))
+        self.assertIsNone(result)
+
+    @mock.patch(
+        "subprocess.run",
+        autospec=True,
+        return_value=mock.Mock(returncode=0, stdout="my-container\n"),
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_returns_container_name(self, *_):
         """Should return container name from docker output."""
-        with mock.patch("jolo.get_container_runtime", return_value="docker"):
-            with mock.patch("subprocess.run") as mock_run:
-                mock_run.return_value = mock.Mock(
-                    returncode=0, stdout="my-container\n"
-                )
-                result = jolo.get_container_for_workspace(
-                    Path("/home/user/project")
-                )
-                self.assertEqual(result, "my-container")
-
-    def test_returns_none_when_no_container(self):
+        result = jolo.get_container_for_workspace(Path("/home/user/project"))
+        self.assertEqual(result, "my-container")
+
+    @mock.patch(
+        "subprocess.run",
+        autospec=True,
+        return_value=mock.Mock(returncode=0, stdout=""),
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_returns_none_when_no_container(self, *_):
         """Should return None when no container found."""
-        with mock.patch("jolo.get_container_runtime", return_value="docker"):
-            with mock.patch("subprocess.run") as mock_run:
-                mock_run.return_value = mock.Mock(returncode=0, stdout="")
-                result = jolo.get_container_for_workspace(
-                    Path("/home/user/project")
-                )
-                self.assertIsNone(result)
+        result = jolo.get_container_for_workspace(Path("/home/user/project"))
+        self.assertIsNone(result)
 
 
 class TestStopContainer(unittest.TestCase):
     """Test container stopping."""
 
-    def test_stop_returns_false_without_runtime(self):
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value=None,
+    )
+    def test_stop_returns_false_without_runtime(self, _runtime):
         """Should return False if no container runtime."""
-        with mock.patch("jolo.get_container_runtime", return_value=None):
-            result = jolo.stop_container(Path("/some/path"))
-            self.assertFalse(result)
-
-    def test_stop_returns_false_when_no_container(self):
+        result = jolo.stop_container(Path("/some/path"))
+        self.assertFalse(result)
+
+    @mock.patch(
+        "_jolo.container.get_container_for_workspace",
+        autospec=True,
+        return_value=None,
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_stop_returns_false_when_no_container(self, *_):
         """Should return False when no container found."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value="docker"
-        ):
-            with mock.patch(
-                "_jolo.container.get_container_for_workspace",
-                return_value=None,
-            ):
-                result = jolo.stop_container(Path("/some/path"))
-                self.assertFalse(result)
-
-    def test_stop_returns_true_on_success(self):
+        result = jolo.stop_container(Path("/some/path"))
+        self.assertFalse(result)
+
+    @mock.patch(
+        "subprocess.run", autospec=True, return_value=mock.Mock(returncode=0)
+    )
+    @mock.patch(
+        "_jolo.container.get_container_for_workspace",
+        autospec=True,
+        return_value="my-container",
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_stop_returns_true_on_success(self, *_):
         """Should return True when container stopped successfully."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value="docker"
-        ):
-            with mock.patch(
-                "_jolo.container.get_container_for_workspace",
-                return_value="my-container",
-            ):
-                with mock.patch("subprocess.run") as mock_run:
-                    mock_run.return_value = mock.Mock(returncode=0)
-                    result = jolo.stop_container(Path("/some/path"))
-                    self.assertTrue(result)
+        result = jolo.stop_container(Path("/some/path"))
+        self.assertTrue(result)
 
 
 class TestRemoveContainer(unittest.TestCase):
     """Test container removal."""
 
-    def test_remove_returns_false_without_runtime(self):
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value=None,
+    )
+    def test_remove_returns_false_without_runtime(self, _runtime):
         """Should return False if no container runtime."""
-        with mock.patch("jolo.get_container_runtime", return_value=None):
-            result = jolo.remove_container("my-container")
-            self.assertFalse(result)
-
-    def test_remove_returns_true_on_success(self):
+        result = jolo.remove_container("my-container")
+        self.assertFalse(result)
+
+    @mock.patch(
+        "subprocess.run", autospec=True, return_value=mock.Mock(returncode=0)
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_remove_returns_true_on_success(self, *_):
         """Should return True when container removed successfully."""
-        with mock.patch("jolo.get_container_runtime", return_value="docker"):
-            with mock.patch("subprocess.run") as mock_run:
-                mock_run.return_value = mock.Mock(returncode=0)
-                result = jolo.remove_container("my-container")
-                self.assertTrue(result)
+        result = jolo.remove_container("my-container")
+        self.assertTrue(result)
 
 
 class TestRemoveImage(unittest.TestCase):
     """Test image removal."""
 
-    def test_remove_image_returns_false_without_runtime(self):
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value=None,
+    )
+    def test_remove_image_returns_false_without_runtime(self, _runtime):
         """Should return False if no container runtime."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value=None
-        ):
-            from _jolo.container import remove_image
-
-            result = remove_image("img123")
-            self.assertFalse(result)
-
-    def test_remove_image_returns_true_on_success(self):
+        from _jolo.container import remove_image
+
+        result = remove_image("img123")
+        self.assertFalse(result)
+
+    @mock.patch(
+        "subprocess.run", autospec=True, return_value=mock.Mock(returncode=0)
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_remove_image_returns_true_on_success(self, _runtime, mock_run):
         """Should return True when image removed successfully."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value="docker"
-        ):
-            with mock.patch("subprocess.run") as mock_run:
-                mock_run.return_value = mock.Mock(returncode=0)
-                from _jolo.container import remove_image
-
-                result = remove_image("img123")
-                self.assertTrue(result)
-                mock_run.assert_called_once_with(
-                    ["docker", "rmi", "img123"],
-                    capture_output=True,
-                    text=True,
-                )
-
-    def test_remove_image_returns_false_on_failure(self):
+        from _jolo.container import remove_image
+
+        result = remove_image("img123")
+        self.assertTrue(result)
+        mock_run.assert_called_once_with(
+            ["docker", "rmi", "img123"],
+            capture_output=True,
+            text=True,
+        )
+
+    @mock.patch(
+        "subprocess.run", autospec=True, return_value=mock.Mock(returncode=1)
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_remove_image_returns_false_on_failure(self, *_):
         """Should return False when rmi fails."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value="docker"
-        ):
-            with mock.patch("subprocess.run") as mock_run:
-                mock_run.return_value = mock.Mock(returncode=1)
-                from _jolo.container import remove_image
+        from _jolo.container import remove_image
 
-                result = remove_image("img123")
-                self.assertFalse(result)
+        result = remove_image("img123")
+        self.assertFalse(result)
 
 
 class TestIsContainerRunning(unittest.TestCase):
     """Test container running check."""
 
-    def test_returns_false_without_runtime(self):
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value=None,
+    )
+    def test_returns_false_without_runtime(self, _runtime):
         """Should return False if no container runtime."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value=None
-        ):
-            result = jolo.is_container_running(Path("/some/path"))
-            self.assertFalse(result)
-
-    def test_returns_true_when_running(self):
+        result = jolo.is_container_running(Path("/some/path"))
+        self.assertFalse(result)
+
+    @mock.patch(
+        "subprocess.run",
+        autospec=True,
+        return_value=mock.Mock(returncode=0, stdout="my-container\n"),
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_returns_true_when_running(self, *_):
         """Should return True when container is running."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value="docker"
-        ):
-            with mock.patch("subprocess.run") as mock_run:
-                mock_run.return_value = mock.Mock(
-                    returncode=0, stdout="my-container\n"
-                )
-                result = jolo.is_container_running(Path("/home/user/project"))
-                self.assertTrue(result)
-
-    def test_returns_false_when_not_running(self):
+        result = jolo.is_container_running(Path("/home/user/project"))
+        self.assertTrue(result)
+
+    @mock.patch(
+        "subprocess.run",
+        autospec=True,
+        return_value=mock.Mock(returncode=0, stdout=""),
+    )
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_returns_false_when_not_running(self, *_):
         """Should return False when no container running."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value="docker"
-        ):
-            with mock.patch("subprocess.run") as mock_run:
-                mock_run.return_value = mock.Mock(returncode=0, stdout="")
-                result = jolo.is_container_running(Path("/home/user/project"))
-                self.assertFalse(result)
+        result = jolo.is_container_running(Path("/home/user/project"))
+        self.assertFalse(result)
 
 
-class TestFindContainersForProject(unittest.TestCase):
-    """Test project container discovery."""
+class _ProjectContainersTestCase(unittest.TestCase):
+    """Shared `docker ps` rows for the /home/user/myapp project."""
 
-    def test_returns_empty_without_runtime(self):
-        """Should return empty list if no container runtime."""
-        with mock.patch(
-            "_jolo.container.get_container_runtime", return_value=None
-        ):
-            result = jolo.find_containers_for_project(Path("/home/user/myapp"))
-            self.assertEqual(result, [])
-
-    def test_finds_main_container(self):
-        """Should find container for the main project directory."""
-        containers = [
-            ("myapp", "/home/user/myapp", "running", "img1"),
+    @classmethod
+    def setUpClass(cls):
+        main = ("myapp", "/home/user/myapp", "running", "img1")
+        cls.containers_main = (
+            main,
             ("other", "/home/user/other", "running", "img2"),
-        ]
-        with mock.patch(
-            "_jolo.container.list_all_devcontainers", return_value=containers
-        ):
-            with mock.patch(
-                "_jolo.container.get_container_runtime", return_value="docker"
-            ):
-                result = jolo.find_containers_for_project(
-                    Path("/home/user/myapp")
-                )
-                self.assertEqual(len(result), 1)
-                self.assertEqual(result[0][0], "myapp")
-
-    def test_finds_worktree_containers(self):
-        """Should find containers for project worktrees."""
-        containers = [
-            ("myapp", "/home/user/myapp", "running", "img1"),
+        )
+        cls.containers_running = (
+            main,
             (
                 "myapp-feat",
                 "/home/user/myapp-worktrees/feat",
                 "running",
                 "img2",
             ),
-        ]
-        with mock.patch(
-            "_jolo.container.list_all_devcontainers", return_value=containers
-        ):
-            with mock.patch(
-                "_jolo.container.get_container_runtime", return_value="docker"
-            ):
-                result = jolo.find_containers_for_project(
-                    Path("/home/user/myapp")
-                )
-                self.assertEqual(len(result), 2)
-
-    def test_state_filter(self):
-        """Should filter by state when specified."""
-        containers = [
-            ("myapp", "/home/user/myapp", "running", "img1"),
+        )
+        cls.containers_mixed = (
+            main,
             (
                 "myapp-old",
                 "/home/user/myapp-worktrees/old",
                 "exited",
                 "img2",
             ),
-        ]
-        with mock.patch(
-            "_jolo.container.list_all_devcontainers", return_value=containers
-        ):
-            with mock.patch(
-                "_jolo.container.get_container_runtime", return_value="docker"
-            ):
-                result = jolo.find_containers_for_project(
-                    Path("/home/user/myapp"), state_filter="running"
-                )
-                self.assertEqual(len(result), 1)
-                self.assertEqual(result[0][0], "myapp")
-
-
-class TestFindStoppedContainersForProject(unittest.TestCase):
-    """Test stopped container discovery."""
+        )
 
-    def test_returns_only_stopped(self):
-        """Should return only non-running containers."""
+
+class TestFindContainersForProject(_ProjectContainersTestCase):
+    """Test project container discovery."""
+
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value=None,
+    )
+    def test_returns_empty_without_runtime(self, _runtime):
+        """Should return empty list if no container runtime."""
+        result = jolo.find_containers_for_project(Path("/home/user/myapp"))
+        self.assertEqual(result, [])
+
+    @mock.patch("_jolo.container.list_all_devcontainers", autospec=True)
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_finds_main_container(self, _runtime, mock_list):
+        """Should find container for the main project directory."""
+        mock_list.return_value = self.containers_main
+        result = jolo.find_containers_for_project(Path("/home/user/myapp"))
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0][0], "myapp")
+
+    @mock.patch("_jolo.container.list_all_devcontainers", autospec=True)
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_finds_worktree_containers(self, _runtime, mock_list):
+        """Should find containers for project worktrees."""
+        mock_list.return_value = self.containers_running
+        result = jolo.find_containers_for_project(Path("/home/user/myapp"))
+        self.assertEqual(len(result), 2)
+
+    @mock.patch("_jolo.container.list_all_devcontainers", autospec=True)
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_state_filter(self, _runtime, mock_list):
+        """Should filter by state when specified."""
+        mock_list.return_value = self.containers_mixed
+        result = jolo.find_containers_for_project(
+            Path("/home/user/myapp"), state_filter="running"
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0][0], "myapp")
+
+    @mock.patch("_jolo.container.list_all_devcontainers", autospec=True)
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_ignores_projects_sharing_name_prefix(self, _runtime, mock_list):
+        """Should not match sibling projects whose path starts the same.
+
+        Labels are normalized, so a trailing slash still matches, and only
+        direct children of ../myapp-worktrees/ count as worktrees.
+        """
         containers = [
             ("myapp", "/home/user/myapp", "running", "img1"),
+            ("myapp-slash", "/home/user/myapp/", "running", "img1"),
             (
-                "myapp-old",
-                "/home/user/myapp-worktrees/old",
-                "exited",
-                "img2",
+                "myapp-feat",
+                "/home/user/myapp-worktrees/feat/",
+                "running",
+                "img1",
+            ),
+            (
+                "nested",
+                "/home/user/myapp-worktrees/feat/sub",
+                "running",
+                "img1",
+            ),
+            ("myapp2", "/home/user/myapp2", "running", "img2"),
+            (
+                "myapp2-feat",
+                "/home/user/myapp2-worktrees/feat",
+                "running",
+                "img3",
+            ),
+            (
+                "elsewhere",
+                "/srv/myapp-worktrees/feat",
+                "running",
+                "img4",
             ),
         ]
-        with mock.patch(
-            "_jolo.container.list_all_devcontainers", return_value=containers
-        ):
-            with mock.patch(
-                "_jolo.container.get_container_runtime", return_value="docker"
-            ):
-                result = jolo.find_stopped_containers_for_project(
-                    Path("/home/user/myapp")
-                )
-                self.assertEqual(len(result), 1)
-                self.assertEqual(result[0][0], "myapp-old")
-
-
-class TestReassignPort(unittest.TestCase):
-    """Test port reassignment."""
+        mock_list.return_value = containers
+        result = jolo.find_containers_for_project(Path("/home/user/myapp"))
+        self.assertEqual(
+            [r[0] for r in result], ["myapp", "myapp-slash", "myapp-feat"]
+        )
+
+
+class TestFindStoppedContainersForProject(_ProjectContainersTestCase):
+    """Test stopped container discovery."""
+
+    @mock.patch("_jolo.container.list_all_devcontainers", autospec=True)
+    @mock.patch(
+        "_jolo.container.get_container_runtime",
+        autospec=True,
+        return_value="docker",
+    )
+    def test_returns_only_stopped(self, _runtime, mock_list):
+        """Should return only non-running containers."""
+        mock_list.return_value = self.containers_mixed
+        result = jolo.find_stopped_containers_for_project(
+            Path("/home/user/myapp")
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0][0], "myapp-old")
+
+
+class _DevcontainerWorkspaceTestCase(unittest.TestCase):
+    """Temp workspace with an empty .devcontainer/ directory."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.ws = Path(self.tmpdir) / "project"
         self.ws.mkdir()
         (self.ws / ".devcontainer").mkdir()
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def _write_config(self, config):
         path = self.ws / ".devcontainer" / "devcontainer.json"
         path.write_text(json.dumps(config, indent=4) + "\n")
@@ -519,7 +618,90 @@ class TestReassignPort(unittest.TestCase):
         path = self.ws / ".devcontainer" / "devcontainer.json"
         return json.loads(path.read_text())
 
-    def test_reassign_updates_port_in_env(self):
+
+class TestSetPort(_DevcontainerWorkspaceTestCase):
+    """Test set_port function."""
+
+    def test_set_port_updates_env(self):
+        """Should update PORT in containerEnv."""
+        self._write_config(
+            {
+                "containerEnv": {"PORT": "4500"},
+                "runArgs": ["-p", "4500:4500"],
+            }
+        )
+
+        from _jolo.container import set_port
+
+        set_port(self.ws, 4200)
+        config = self._read_config()
+        self.assertEqual(config["containerEnv"]["PORT"], "4200")
+
+    def test_set_port_updates_run_args(self):
+        """Should update -p flag in runArgs."""
+        self._write_config(
+            {
+                "containerEnv": {"PORT": "4500"},
+                "runArgs": ["--name", "myapp", "-p", "4500:4500"],
+            }
+        )
+
+        from _jolo.container import set_port
+
+        set_port(self.ws, 4200)
+        config = self._read_config()
+        self.assertIn("4200:4200", config["runArgs"])
+        self.assertNotIn("4500:4500", config["runArgs"])
+
+    def test_set_port_errors_without_devcontainer(self):
+        """Should exit if devcontainer.json doesn't exist."""
+        ws = Path(self.tmpdir) / "empty"
+        ws.mkdir()
+        (ws / ".devcontainer").mkdir()
+
+        from _jolo.container import set_port
+
+        with self.assertRaises(SystemExit):
+            set_port(ws, 4200)
+
+    def test_set_port_creates_container_env_if_missing(self):
+        """Should create containerEnv if not present."""
+        self._write_config({"runArgs": ["-p", "4500:4500"]})
+
+        from _jolo.container import set_port
+
+        set_port(self.ws, 4200)
+        config = self._read_config()
+        self.assertEqual(config["containerEnv"]["PORT"], "4200")
+
+    def test_set_port_leaves_other_args_unchanged(self):
+        """Should only update PORT and -p flag, not other runArgs."""
+        self._write_config(
+            {
+                "containerEnv": {"PORT": "4500"},
+                "runArgs": ["--name", "myapp", "-p", "4500:4500"],
+            }
+        )
+
+        from _jolo.container import set_port
+
+        set_port(self.ws, 4200)
+        config = self._read_config()
+        self.assertEqual(config["containerEnv"]["PORT"], "4200")
+        self.assertIn("--name", config["runArgs"])
+        self.assertIn("myapp", config["runArgs"])
+
+
+class TestReassignPort(_DevcontainerWorkspaceTestCase):
+    """Test port reassignment."""
+
+    @mock.patch(
+        "_jolo.container.is_port_available", autospec=True, return_value=True
+    )
+    @mock.patch(
+        "_jolo.container.random_port", autospec=True, return_value=4777
+    )
+    def test_reassign_updates_port_in_env(self, *_):
         """Should update PORT in containerEnv."""
         self._write_config(
             {
@@ -530,17 +712,19 @@ class TestReassignPort(unittest.TestCase):
 
         from _jolo.container import reassign_port
 
-        with mock.patch("_jolo.container.random_port", return_value=4777):
-            with mock.patch(
-                "_jolo.container.is_port_available", return_value=True
-            ):
-                result = reassign_port(self.ws)
+        result = reassign_port(self.ws)
 
         self.assertEqual(result, 4777)
         config = self._read_config()
         self.assertEqual(config["containerEnv"]["PORT"], "4777")
 
-    def test_reassign_updates_run_args(self):
+    @mock.patch(
+        "_jolo.container.is_port_available", autospec=True, return_value=True
+    )
+    @mock.patch(
+        "_jolo.container.random_port", autospec=True, return_value=4888
+    )
+    def test_reassign_updates_run_args(self, *_):
         """Should update -p flag in runArgs."""
         self._write_config(
             {
@@ -551,17 +735,23 @@ class TestReassignPort(unittest.TestCase):
 
         from _jolo.container import reassign_port
 
-        with mock.patch("_jolo.container.random_port", return_value=4888):
-            with mock.patch(
-                "_jolo.container.is_port_available", return_value=True
-            ):
-                reassign_port(self.ws)
+        reassign_port(self.ws)
 
         config = self._read_config()
         self.assertIn("4888:4888", config["runArgs"])
         self.assertNotIn("4500:4500", config["runArgs"])
 
-    def test_reassign_retries_until_available(self):
+    @mock.patch(
+        "_jolo.container.is_port_available",
+        autospec=True,
+        side_effect=[False, False, True],
+    )
+    @mock.patch(
+        "_jolo.container.random_port",
+        autospec=True,
+        side_effect=[4001, 4002, 4003],
+    )
+    def test_reassign_retries_until_available(self, *_):
         """Should retry random_port when port is unavailable."""
         self._write_config(
             {
@@ -572,14 +762,7 @@ class TestReassignPort(unittest.TestCase):
 
         from _jolo.container import reassign_port
 
-        with mock.patch(
-            "_jolo.container.random_port", side_effect=[4001, 4002, 4003]
-        ):
-            with mock.patch(
-                "_jolo.container.is_port_available",
-                side_effect=[False, False, True],
-            ):
-                result = reassign_port(self.ws)
+        result = reassign_port(self.ws)
 
         self.assertEqual(result, 4003)
 
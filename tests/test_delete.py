@@ -1,419 +1,358 @@
 #!/usr/bin/env python3
 """Tests for jolo delete command (unified worktree + project deletion)."""
 
+import contextlib
+import functools
+import io
+import sys
+import types
 import unittest
 from pathlib import Path
 from unittest import mock
 
 import jolo
+from _jolo import commands as _cmds
+from _jolo.cli import _build_parser
+
+# Built once; argparse parsers hold no per-parse state
+_PARSER = _build_parser()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse(*argv):
+    """Parse argv once per distinct tuple; callers only read the result."""
+    return _PARSER.parse_args(argv)
+
+
+# Paths are immutable, so the fake layout is built once
+PROJECT = Path("/fake/project")
+WT = Path("/fake/project-worktrees/feat")
+MYAPP = Path("/fake/myapp")
+
+# list_worktrees results; run_delete_mode only iterates them
+MAIN_ONLY = ((PROJECT, "abc123", "main"),)
+MYAPP_ONLY = ((MYAPP, "abc123", "main"),)
+WITH_WORKTREE = (*MAIN_ONLY, (WT, "def456", "feat"))
+
+# Concrete flavour (PosixPath/WindowsPath); Path itself can't be
+# subclassed directly before Python 3.12
+_REAL_PATH = type(PROJECT)
+
+# Shared subprocess.run result; callers only read it (text=True, so str)
+_SUBPROC_OK = types.SimpleNamespace(returncode=0, stdout="", stderr="")
+
+
+def _ns(target=None, yes=False, purge=False):
+    """Build delete args directly; behaviour tests don't exercise argparse."""
+    return types.SimpleNamespace(
+        command="delete", target=target, yes=yes, purge=purge, verbose=False
+    )
 
 
 class TestDeleteArgParsing(unittest.TestCase):
     """Test delete argument parsing."""
 
-    def test_delete_command(self):
-        """delete should set command to delete."""
-        args = jolo.parse_args(["delete"])
-        self.assertEqual(args.command, "delete")
-
-    def test_delete_with_target_name(self):
-        """delete TARGET should set target."""
-        args = jolo.parse_args(["delete", "feature-x"])
-        self.assertEqual(args.target, "feature-x")
-
-    def test_delete_with_path_target(self):
-        """delete /some/path should set target to path."""
-        args = jolo.parse_args(["delete", "/tmp/myproject"])
-        self.assertEqual(args.target, "/tmp/myproject")
-
-    def test_delete_target_optional(self):
-        """delete without target should default to None (interactive)."""
-        args = jolo.parse_args(["delete"])
-        self.assertIsNone(args.target)
-
-    def test_delete_yes_flag(self):
-        """--yes should skip confirmation."""
-        args = jolo.parse_args(["delete", "feature-x", "--yes"])
-        self.assertTrue(args.yes)
-
-    def test_delete_purge_flag(self):
-        """--purge should be recognized."""
-        args = jolo.parse_args(["delete", "--purge"])
-        self.assertTrue(args.purge)
-
-    def test_delete_purge_default_false(self):
-        """--purge should default to False."""
-        args = jolo.parse_args(["delete"])
-        self.assertFalse(args.purge)
+    CASES = [
+        # (argv, attribute, expected)
+        (["delete"], "command", "delete"),
+        (["delete", "feature-x"], "target", "feature-x"),
+        (["delete", "/tmp/myproject"], "target", "/tmp/myproject"),
+        # No target means interactive picker
+        (["delete"], "target", None),
+        (["delete", "feature-x", "--yes"], "yes", True),
+        (["delete", "--purge"], "purge", True),
+        (["delete"], "purge", False),
+    ]
+
+    def test_parse(self):
+        """delete flags and target should land on the namespace."""
+        for argv, attr, expected in self.CASES:
+            with self.subTest(argv=argv, attr=attr):
+                args = _parse(*argv)
+                self.assertEqual(getattr(args, attr), expected)
+
+    def test_ns_matches_parser(self):
+        """_ns() should mirror what the parser produces for delete."""
+        parsed = _parse("delete", "x", "--yes", "--purge")
+        for attr, value in vars(_ns("x", yes=True, purge=True)).items():
+            with self.subTest(attr=attr):
+                self.assertEqual(getattr(parsed, attr), value)
 
     def test_destroy_command_removed(self):
         """destroy subcommand should no longer exist."""
+        self.enterContext(contextlib.redirect_stderr(io.StringIO()))
         with self.assertRaises(SystemExit):
-            jolo.parse_args(["destroy"])
-
-
-class TestDeleteProjectByName(unittest.TestCase):
+            _PARSER.parse_args(["destroy"])
+
+
+class _NoInput(io.StringIO):
+    """stdin that fails the test as soon as input() reads from it."""
+
+    def readline(self, size=-1):
+        raise AssertionError("unexpected input() prompt")
+
+
+class _DeleteMocks:
+    """Patched run_delete_mode collaborators; slots catch misspelt names."""
+
+    __slots__ = (
+        "git_root",
+        "all_containers",
+        "runtime",
+        "find_containers",
+        "list",
+        "stop",
+        "remove_wt",
+        "remove",
+    )
+
+
+class _DeleteModeTestCase(unittest.TestCase):
+    """Patch the container/worktree helpers run_delete_mode talks to.
+
+    Defaults describe a podman host with a single-worktree project and
+    no containers, on a fake filesystem where every path exists and cwd
+    is /fake. Tests override only what they care about via
+    ``self.mocks`` and ``self.fake_fs()``.
+    """
+
+    # name -> (owner, attribute); resolved once at class creation
+    PATCHES = {
+        "git_root": (_cmds, "find_git_root"),
+        "all_containers": (_cmds, "list_all_devcontainers"),
+        "runtime": (_cmds, "get_container_runtime"),
+        "find_containers": (_cmds, "find_containers_for_project"),
+        "list": (_cmds, "list_worktrees"),
+        "stop": (_cmds, "stop_container"),
+        "remove_wt": (_cmds, "remove_worktree"),
+        "remove": (_cmds, "remove_container"),
+    }
+
+    # Autospec introspection is the costly part of building these mocks,
+    # so do it once and reset per test. copy.copy() is no shortcut here:
+    # it hands back the very same function object.
+    AUTOSPECS = {
+        name: mock.create_autospec(getattr(owner, attr))
+        for name, (owner, attr) in PATCHES.items()
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Installed once per class; setUp only resets them. (A stand-in
+        # module in sys.modules wouldn't help: run_delete_mode reads the
+        # real module's globals.)
+        for name, (owner, attr) in cls.PATCHES.items():
+            cls.addClassCleanup(setattr, owner, attr, getattr(owner, attr))
+            setattr(owner, attr, cls.AUTOSPECS[name])
+
+    def setUp(self):
+        self.mocks = _DeleteMocks()
+        for name, fake in self.AUTOSPECS.items():
+            # Plain functions are specced as functions wrapping .mock;
+            # lru_cache'd ones (get_container_runtime) as a MagicMock
+            getattr(fake, "mock", fake).reset_mock(
+                return_value=True, side_effect=True
+            )
+            setattr(self.mocks, name, fake)
+        self.mocks.runtime.return_value = "podman"
+        self.mocks.list.return_value = MAIN_ONLY
+        self.mocks.find_containers.return_value = []
+        self.mocks.stop.return_value = True
+        self.mocks.remove_wt.return_value = True
+        self.mocks.remove.return_value = True
+        # Directories rmtree was asked to remove
+        self.removed = []
+        self.swap(_cmds.shutil, "rmtree", self.removed.append)
+        self.fake_run()
+        self.fake_fs()
+
+    def swap(self, owner, attr, value):
+        """Set owner.attr to value until the test ends; return value.
+
+        A plain setattr plus cleanup, skipping mock.patch's bookkeeping.
+        """
+        self.addCleanup(setattr, owner, attr, getattr(owner, attr))
+        setattr(owner, attr, value)
+        return value
+
+    def fake_input(self, *answers):
+        """Feed answers to input() through a swapped-in sys.stdin.
+
+        With no answers, any prompt fails the test.
+        """
+        if answers:
+            stdin = io.StringIO("".join(f"{a}\n" for a in answers))
+        else:
+            stdin = _NoInput()
+        self.swap(sys, "stdin", stdin)
+
+    def fake_run(self, stdout=None):
+        """Stub subprocess.run with a canned successful result."""
+        if stdout is None:
+            result = _SUBPROC_OK
+        else:
+            result = types.SimpleNamespace(
+                returncode=0, stdout=stdout, stderr=""
+            )
+        self.swap(_cmds.subprocess, "run", lambda *a, **kw: result)
+
+    def fake_fs(self, exists=True, is_file=False, cwd="/fake"):
+        """Point _jolo.commands at a Path subclass with canned answers.
+
+        ``exists`` may be a bool or a list of answers for successive calls.
+        Only the binding in _jolo.commands changes; pathlib.Path itself is
+        left alone for the rest of the interpreter. Later calls win.
+        """
+        if isinstance(exists, list):
+            answers = iter(exists)
+            exists_fn = lambda self, **kw: next(answers)  # noqa: E731
+        else:
+            exists_fn = lambda self, **kw: exists  # noqa: E731
+        fake_path = type(
+            "FakePath",
+            (_REAL_PATH,),
+            {
+                "exists": exists_fn,
+                "is_file": lambda self, **kw: is_file,
+                "resolve": lambda self, strict=False: self,
+                "cwd": classmethod(lambda cls: cls(cwd)),
+            },
+        )
+        self.swap(_cmds, "Path", fake_path)
+
+
+class TestDeleteProjectByName(_DeleteModeTestCase):
     """Test deleting a project by bare name (cwd / name)."""
 
-    @mock.patch("_jolo.commands.get_container_runtime")
-    @mock.patch("_jolo.commands.find_containers_for_project")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.remove_container")
-    @mock.patch("_jolo.commands.subprocess.run")
-    def test_bare_name_resolves_project_in_cwd(
-        self,
-        mock_subproc,
-        mock_remove,
-        mock_list,
-        mock_find_containers,
-        mock_runtime,
-    ):
+    def test_bare_name_resolves_project_in_cwd(self):
         """Bare name should resolve to cwd/name as a project."""
-        project = Path("/fake/myapp")
-        mock_runtime.return_value = "podman"
-        mock_list.return_value = [(project, "abc123", "main")]
-        mock_find_containers.return_value = []
-        mock_remove.return_value = True
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch("os.getcwd", return_value="/fake"):
-                args = jolo.parse_args(["delete", "myapp", "--yes"])
-                jolo.run_delete_mode(args)
-
-    def test_bare_name_errors_when_not_found(self):
-        """Bare name should error when cwd/name doesn't exist."""
-        with mock.patch.object(Path, "exists", return_value=False):
-            with mock.patch("os.getcwd", return_value="/fake"):
-                args = jolo.parse_args(["delete", "nonexistent"])
-                with self.assertRaises(SystemExit) as cm:
-                    jolo.run_delete_mode(args)
-                self.assertIn("not found", str(cm.exception).lower())
-
-    def test_bare_name_errors_when_not_git_repo(self):
-        """Bare name should error when cwd/name exists but has no .git."""
-        # First exists() → True (directory), second → False (.git)
-        with mock.patch.object(Path, "exists", side_effect=[True, False]):
-            with mock.patch("os.getcwd", return_value="/fake"):
-                args = jolo.parse_args(["delete", "myapp"])
-                with self.assertRaises(SystemExit) as cm:
-                    jolo.run_delete_mode(args)
-                self.assertIn("not a git", str(cm.exception).lower())
+        self.mocks.list.return_value = MYAPP_ONLY
 
-    def test_bare_name_errors_when_target_is_worktree(self):
-        """Bare name should error when cwd/name is a worktree, not a project."""
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "is_file", return_value=True):
-                with mock.patch("os.getcwd", return_value="/fake"):
-                    args = jolo.parse_args(["delete", "myapp-worktrees/feat"])
-                    with self.assertRaises(SystemExit) as cm:
-                        jolo.run_delete_mode(args)
-                    self.assertIn("worktree", str(cm.exception).lower())
+        args = _ns("myapp", yes=True)
+        jolo.run_delete_mode(args)
 
+    # (target, fake_fs kwargs, expected message)
+    INVALID_TARGETS = [
+        # cwd/name exists (first exists()) but has no .git (second)
+        ("myapp", {"exists": [True, False]}, "not a git"),
+        # .git is a file: cwd/name is a worktree, not a project
+        ("myapp-worktrees/feat", {"is_file": True}, "worktree"),
+    ]
 
-class TestDeleteInteractivePurgePrompt(unittest.TestCase):
-    """Test interactive purge prompt (ask instead of requiring --purge)."""
+    def test_bare_name_errors_on_non_project(self):
+        """Bare name should error unless cwd/name is a project root."""
+        for target, fs, message in self.INVALID_TARGETS:
+            with self.subTest(target=target):
+                self.fake_fs(**fs)
+                with self.assertRaisesRegex(SystemExit, f"(?i){message}"):
+                    jolo.run_delete_mode(_ns(target))
 
-    @mock.patch("_jolo.commands.get_container_runtime")
-    @mock.patch("_jolo.commands.find_containers_for_project")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.remove_container")
-    @mock.patch("_jolo.commands.subprocess.run")
-    @mock.patch("_jolo.commands.shutil.rmtree")
-    def test_purge_prompt_yes_removes_dirs(
-        self,
-        mock_rmtree,
-        mock_subproc,
-        mock_remove,
-        mock_list,
-        mock_find_containers,
-        mock_runtime,
-    ):
-        """Answering 'y' to purge prompt should remove directories."""
-        project = Path("/fake/project")
-        mock_runtime.return_value = "podman"
-        mock_list.return_value = [(project, "abc123", "main")]
-        mock_find_containers.return_value = []
-        mock_remove.return_value = True
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "resolve", return_value=project):
-                # First 'y' confirms deletion, second 'y' confirms purge
-                with mock.patch("builtins.input", side_effect=["y", "y"]):
-                    args = jolo.parse_args(["delete", "/fake/project"])
-                    jolo.run_delete_mode(args)
 
-        mock_rmtree.assert_called()
-
-    @mock.patch("_jolo.commands.get_container_runtime")
-    @mock.patch("_jolo.commands.find_containers_for_project")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.remove_container")
-    @mock.patch("_jolo.commands.subprocess.run")
-    @mock.patch("_jolo.commands.shutil.rmtree")
-    def test_purge_prompt_no_keeps_dirs(
-        self,
-        mock_rmtree,
-        mock_subproc,
-        mock_remove,
-        mock_list,
-        mock_find_containers,
-        mock_runtime,
-    ):
-        """Answering 'n' to purge prompt should keep directories."""
-        project = Path("/fake/project")
-        mock_runtime.return_value = "podman"
-        mock_list.return_value = [(project, "abc123", "main")]
-        mock_find_containers.return_value = []
-        mock_remove.return_value = True
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "resolve", return_value=project):
-                # First 'y' confirms deletion, second 'n' declines purge
-                with mock.patch("builtins.input", side_effect=["y", "n"]):
-                    args = jolo.parse_args(["delete", "/fake/project"])
-                    jolo.run_delete_mode(args)
+class TestDeleteInteractivePurgePrompt(_DeleteModeTestCase):
+    """Test interactive purge prompt (ask instead of requiring --purge)."""
 
-        mock_rmtree.assert_not_called()
-
-    @mock.patch("_jolo.commands.get_container_runtime")
-    @mock.patch("_jolo.commands.find_containers_for_project")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.remove_container")
-    @mock.patch("_jolo.commands.subprocess.run")
-    @mock.patch("_jolo.commands.shutil.rmtree")
-    def test_purge_flag_with_yes_skips_prompt(
-        self,
-        mock_rmtree,
-        mock_subproc,
-        mock_remove,
-        mock_list,
-        mock_find_containers,
-        mock_runtime,
-    ):
+    def test_purge_prompt_answer_decides_removal(self):
+        """The purge prompt answer alone decides whether dirs go."""
+        for answer, purged in (("y", True), ("n", False)):
+            with self.subTest(answer=answer):
+                self.removed.clear()
+                # First 'y' confirms deletion, second answers the purge
+                self.fake_input("y", answer)
+                jolo.run_delete_mode(_ns("/fake/project"))
+                self.assertEqual(bool(self.removed), purged)
+
+    def test_purge_flag_with_yes_skips_prompt(self):
         """--purge --yes should purge without asking."""
-        project = Path("/fake/project")
-        mock_runtime.return_value = "podman"
-        mock_list.return_value = [(project, "abc123", "main")]
-        mock_find_containers.return_value = []
-        mock_remove.return_value = True
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "resolve", return_value=project):
-                args = jolo.parse_args(
-                    ["delete", "/fake/project", "--purge", "--yes"]
-                )
-                with mock.patch("builtins.input") as mock_input:
-                    jolo.run_delete_mode(args)
-                    mock_input.assert_not_called()
+        args = _ns("/fake/project", yes=True, purge=True)
+        self.fake_input()
+        jolo.run_delete_mode(args)
 
-        mock_rmtree.assert_called()
+        self.assertTrue(self.removed)
 
 
-class TestDeleteProjectByPath(unittest.TestCase):
+class TestDeleteProjectByPath(_DeleteModeTestCase):
     """Test deleting a project by path."""
 
-    def test_path_target_resolves_project(self):
-        """Path starting with / should be treated as project deletion."""
-        args = jolo.parse_args(["delete", "/nonexistent/path"])
-        with self.assertRaises(SystemExit) as cm:
-            jolo.run_delete_mode(args)
-        self.assertIn("not found", str(cm.exception).lower())
+    def test_missing_target_exits(self):
+        """Absolute, dot and bare targets resolve to a project path."""
+        self.fake_fs(exists=False)
 
-    def test_dot_path_treated_as_project(self):
-        """Path starting with . should be treated as project deletion."""
-        args = jolo.parse_args(["delete", "./nonexistent"])
-        with self.assertRaises(SystemExit):
-            jolo.run_delete_mode(args)
+        for target in ("/nonexistent/path", "./nonexistent", "nonexistent"):
+            with self.subTest(target=target):
+                args = _ns(target)
+                with self.assertRaisesRegex(SystemExit, "(?i)not found"):
+                    jolo.run_delete_mode(args)
 
-    @mock.patch("_jolo.commands.get_container_runtime")
-    @mock.patch("_jolo.commands.find_containers_for_project")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.remove_container")
-    @mock.patch("_jolo.commands.subprocess.run")
-    @mock.patch("builtins.input", return_value="y")
-    def test_delete_project_stops_and_removes_containers(
-        self,
-        mock_input,
-        mock_subproc,
-        mock_remove,
-        mock_list,
-        mock_find_containers,
-        mock_runtime,
-    ):
+    def test_delete_project_stops_and_removes_containers(self):
         """Deleting a project should stop and remove its containers."""
-        project = Path("/fake/project")
-        mock_runtime.return_value = "podman"
-        mock_list.return_value = [(project, "abc123", "main")]  # no worktrees
-        mock_find_containers.return_value = [
+        self.mocks.find_containers.return_value = [
             ("test-container", "/fake/project", "running", "img123")
         ]
-        mock_subproc.return_value = mock.MagicMock(returncode=0)
-        mock_remove.return_value = True
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "resolve", return_value=project):
-                args = jolo.parse_args(["delete", "/fake/project", "--yes"])
-                jolo.run_delete_mode(args)
-
-        mock_remove.assert_called_once()
-
-    @mock.patch("_jolo.commands.get_container_runtime")
-    @mock.patch("_jolo.commands.find_containers_for_project")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.remove_container")
-    @mock.patch("_jolo.commands.subprocess.run")
-    @mock.patch("_jolo.commands.shutil.rmtree")
-    def test_purge_removes_directories(
-        self,
-        mock_rmtree,
-        mock_subproc,
-        mock_remove,
-        mock_list,
-        mock_find_containers,
-        mock_runtime,
-    ):
+        self.fake_input("y")
+        args = _ns("/fake/project", yes=True)
+        jolo.run_delete_mode(args)
+
+        self.mocks.remove.assert_called_once()
+
+    def test_purge_removes_directories(self):
         """--purge should remove project directories."""
-        project = Path("/fake/project")
-        mock_runtime.return_value = "podman"
-        mock_list.return_value = [(project, "abc123", "main")]
-        mock_find_containers.return_value = []
-        mock_remove.return_value = True
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "resolve", return_value=project):
-                args = jolo.parse_args(
-                    ["delete", "/fake/project", "--purge", "--yes"]
-                )
-                jolo.run_delete_mode(args)
+        args = _ns("/fake/project", yes=True, purge=True)
+        jolo.run_delete_mode(args)
 
         # Should have called rmtree for the project directory
-        mock_rmtree.assert_called()
+        self.assertTrue(self.removed)
 
 
-class TestDeleteProjectWithWorktrees(unittest.TestCase):
+class TestDeleteProjectWithWorktrees(_DeleteModeTestCase):
     """Test deleting a project that has worktrees."""
 
-    @mock.patch("_jolo.commands.get_container_runtime")
-    @mock.patch("_jolo.commands.find_containers_for_project")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.stop_container")
-    @mock.patch("_jolo.commands.remove_worktree")
-    @mock.patch("_jolo.commands.remove_container")
-    @mock.patch("_jolo.commands.subprocess.run")
-    def test_yes_deletes_worktrees_too(
-        self,
-        mock_subproc,
-        mock_remove_container,
-        mock_remove_wt,
-        mock_stop,
-        mock_list,
-        mock_find_containers,
-        mock_runtime,
-    ):
+    def setUp(self):
+        super().setUp()
+        self.mocks.list.return_value = WITH_WORKTREE
+
+    def test_yes_deletes_worktrees_too(self):
         """With --yes, project deletion should also delete worktrees."""
-        project = Path("/fake/project")
-        wt_path = Path("/fake/project-worktrees/feat")
-        mock_runtime.return_value = "podman"
-        mock_list.return_value = [
-            (project, "abc123", "main"),
-            (wt_path, "def456", "feat"),
-        ]
-        mock_find_containers.return_value = []
-        mock_stop.return_value = True
-        mock_remove_wt.return_value = True
-        mock_remove_container.return_value = True
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "resolve", return_value=project):
-                args = jolo.parse_args(["delete", "/fake/project", "--yes"])
-                jolo.run_delete_mode(args)
-
-        mock_remove_wt.assert_called_once()
-
-    @mock.patch("_jolo.commands.get_container_runtime")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.find_containers_for_project")
-    @mock.patch("builtins.input", return_value="n")
-    def test_prompt_about_worktrees_without_yes(
-        self,
-        mock_input,
-        mock_find_containers,
-        mock_list,
-        mock_runtime,
-    ):
-        """Without --yes, should prompt about worktree deletion and cancel on 'n'."""
-        project = Path("/fake/project")
-        wt_path = Path("/fake/project-worktrees/feat")
-        mock_runtime.return_value = "podman"
-        mock_list.return_value = [
-            (project, "abc123", "main"),
-            (wt_path, "def456", "feat"),
-        ]
-        mock_find_containers.return_value = []
+        args = _ns("/fake/project", yes=True)
+        jolo.run_delete_mode(args)
 
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "resolve", return_value=project):
-                args = jolo.parse_args(["delete", "/fake/project"])
-                with mock.patch("builtins.input", side_effect=["y", "n"]):
-                    jolo.run_delete_mode(args)
+        self.mocks.remove_wt.assert_called_once()
+
+    def test_prompt_about_worktrees_without_yes(self):
+        """Without --yes, should prompt about worktree deletion and cancel on 'n'."""
+        args = _ns("/fake/project")
+        self.fake_input("y", "n")
+        jolo.run_delete_mode(args)
 
 
-class TestDeleteInteractivePicker(unittest.TestCase):
+class TestDeleteInteractivePicker(_DeleteModeTestCase):
     """Test interactive picker mode (no target arg)."""
 
-    @mock.patch("_jolo.commands.find_git_root")
-    @mock.patch("_jolo.commands.list_all_devcontainers")
-    def test_no_items_exits(self, mock_containers, mock_git_root):
+    def test_no_items_exits(self):
         """Should exit when no items found."""
-        mock_git_root.return_value = None
-        mock_containers.return_value = []
+        self.mocks.git_root.return_value = None
+        self.mocks.all_containers.return_value = []
 
-        args = jolo.parse_args(["delete"])
+        args = _ns()
         with self.assertRaises(SystemExit):
             jolo.run_delete_mode(args)
 
-    @mock.patch("_jolo.commands.find_git_root")
-    @mock.patch("_jolo.commands.list_all_devcontainers")
-    @mock.patch("_jolo.commands.list_worktrees")
-    @mock.patch("_jolo.commands.stop_container")
-    @mock.patch("_jolo.commands.remove_worktree")
-    @mock.patch("builtins.input")
-    def test_picker_selects_worktree(
-        self,
-        mock_input,
-        mock_remove,
-        mock_stop,
-        mock_list,
-        mock_containers,
-        mock_git_root,
-    ):
+    def test_picker_selects_worktree(self):
         """Interactive picker should allow selecting a worktree."""
-        project = Path("/fake/project")
-        wt_path = Path("/fake/project-worktrees/feat")
-        with mock.patch("_jolo.commands.find_git_root") as mock_fgr:
-            mock_fgr.return_value = project
-            mock_containers.return_value = [
-                ("proj", "/fake/project", "running", "img123"),
-            ]
-            mock_list.return_value = [
-                (project, "abc123", "main"),
-                (wt_path, "def456", "feat"),
-            ]
-            with mock.patch.object(Path, "exists", return_value=True):
-                # fzf returns the worktree label (second item)
-                wt_label = f"  {'project / feat':<22} [def456]"
-                fzf_result = mock.Mock(returncode=0, stdout=wt_label + "\n")
-                mock_input.return_value = "y"
-                mock_stop.return_value = True
-                mock_remove.return_value = True
-
-                with mock.patch(
-                    "_jolo.commands.subprocess.run", return_value=fzf_result
-                ):
-                    args = jolo.parse_args(["delete"])
-                    jolo.run_delete_mode(args)
+        self.mocks.git_root.return_value = PROJECT
+        self.mocks.all_containers.return_value = [
+            ("proj", "/fake/project", "running", "img123"),
+        ]
+        self.mocks.list.return_value = WITH_WORKTREE
+        # fzf returns the worktree label (second item)
+        wt_label = f"  {'project / feat':<22} [def456]"
+        self.fake_run(stdout=wt_label + "\n")
+
+        self.fake_input("y")
+        args = _ns()
+        jolo.run_delete_mode(args)
 
-                mock_remove.assert_called_once()
+        self.mocks.remove_wt.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -1,136 +1,320 @@
 #!/usr/bin/env python3
 """Integration tests spanning multiple modules."""
 
+import argparse
+import contextlib
 import os
+import shutil
 import tempfile
+import tomllib
 import unittest
 from pathlib import Path
 from unittest import mock
 
-import jolo
-
-
-class TestCreateModeFlavorIntegration(unittest.TestCase):
-    """Integration tests for run_create_mode() flavor handling."""
+# Files the typescript-web (BETH) scaffold writes
+BETH_FILES = (
+    "src/index.tsx",
+    "src/styles.css",
+    "src/pages/home.tsx",
+    "src/components/layout.tsx",
+    "public/.gitkeep",
+)
+# Files copied verbatim from templates/ into every project
+TEMPLATE_FILES = (
+    ".gitignore",
+    ".editorconfig",
+    "AGENTS.md",
+    "CLAUDE.md",
+    "GEMINI.md",
+)
+
+# flavor spec -> relpath -> substrings the scaffolded file must contain
+EXPECTED = {
+    "python-web,typescript": {
+        ".pre-commit-config.yaml": ("ruff", "biome"),
+    },
+    "rust": {
+        ".pre-commit-config.yaml": (
+            "cargo-check",
+            "fmt",
+            "trailing-whitespace",
+            "gitleaks",
+        ),
+    },
+    "typescript": {
+        "src/example.test.ts": ("bun:test",),
+    },
+    "typescript-web": {
+        "tsconfig.json": ("strict", "jsx"),
+        # Bun inspector for profiling in dev
+        "justfile": ("--inspect=0.0.0.0:$(($PORT + 1000))",),
+        ".envrc": ("APP_PROFILE=1",),
+    },
+    # The first flavor is primary for scaffold output
+    "go,python": {
+        "go.mod": ("module testproj",),
+    },
+    "go-web": {
+        "main.go": (
+            "handleHome",
+            "handleGreet",
+            "/api/greet",
+            '"testproj/components"',
+            "net/http/pprof",
+            "/debug/pprof/",
+        ),
+        "components/page.templ": ('href="#main"',),
+        "components/home.templ": ('<main id="main">',),
+        "justfile": ("air",),
+        ".envrc": ("APP_PROFILE=1",),
+        # .air.toml drives templ generation + app rebuild
+        ".air.toml": (
+            "templ generate && go build",
+            'entrypoint = ["./tmp/main"]',
+            'exclude_regex = [".*_templ.go"]',
+        ),
+        "static/.gitkeep": (),
+    },
+    "python-web": {
+        "src/testproj/app.py": (
+            "FastAPI",
+            "Jinja2Templates",
+            "pyinstrument",
+            'request.query_params.get("profile")',
+        ),
+        "src/testproj/main.py": ("uvicorn", "testproj.app:app"),
+        "templates/base.html": ("htmx", 'href="#main"'),
+        "templates/home.html": (),
+        "pyproject.toml": ("fastapi", "uvicorn", "jinja2"),
+        "justfile": ("uvicorn", "--reload"),
+        ".envrc": ("APP_PROFILE=1",),
+        "static/.gitkeep": (),
+    },
+    "rust-web": {
+        "src/main.rs": ('"/debug/pprof/profile"', "ProfilerGuard"),
+        ".envrc": ("APP_PROFILE=1",),
+    },
+}
+
+_BASE = None
+# Bound in setUpModule, so a skipped module never pays for the import
+jolo = None
+# One parsed `create testproj -d`; see create_args()
+_CREATE_ARGS = None
+
+
+def create_args(spec=None):
+    """Fresh copy of `create testproj [--flavor spec] -d` args."""
+    flavor = jolo.parse_flavor_arg(spec) if spec else None
+    return argparse.Namespace(**{**vars(_CREATE_ARGS), "flavor": flavor})
+
+
+def setUpModule():
+    """Create one scratch root; each test works in its own subdirectory."""
+    global _BASE, _CREATE_ARGS, jolo
+    # create/init shell out to the real git (init, add, commit)
+    if shutil.which("git") is None:
+        raise unittest.SkipTest("git not installed")
+    import jolo
+
+    _CREATE_ARGS = jolo.parse_args(["create", "testproj", "-d"])
+    # Scaffolds are lots of small files: keep them on tmpfs when it's
+    # there, unless TMPDIR says otherwise
+    shm = "/dev/shm"
+    use_shm = "TMPDIR" not in os.environ and os.access(shm, os.W_OK)
+    _BASE = tempfile.TemporaryDirectory(dir=shm if use_shm else None)
+
+
+def tearDownModule():
+    _BASE.cleanup()
+
+
+def exec_script(exec_command, start=0):
+    """Join the command strings passed to a devcontainer_exec_command mock.
+
+    Only calls from index start on are included. Checks are substring
+    tests on the commands themselves, so skip str(call), which also
+    formats the workspace path and kwargs.
+    """
+    return "\n".join(
+        c.args[1] if len(c.args) > 1 else c.kwargs["command"]
+        for c in exec_command.call_args_list[start:]
+    )
+
+
+# Modules whose Path.cwd() create and init consult; see in_dir()
+_CWD_MODULES = ("_jolo.cli", "_jolo.commands", "_jolo.worktree")
+
+
+@contextlib.contextmanager
+def in_dir(path):
+    """Make create/init see path as the cwd, without os.chdir.
+
+    The modules create and init resolve the cwd in get a Path subclass
+    whose cwd() answers path, and _jolo.commands' os.chdir() is a no-op,
+    so the process cwd never moves; create and init use absolute paths
+    from there on. pathlib.Path itself is left alone for the rest of the
+    interpreter.
+    """
+    cwd_path = type(
+        "InDirPath",
+        (type(Path()),),
+        {"cwd": classmethod(lambda cls: cls(path))},
+    )
+    with contextlib.ExitStack() as stack:
+        for module in _CWD_MODULES:
+            stack.enter_context(mock.patch(f"{module}.Path", cwd_path))
+        stack.enter_context(mock.patch("_jolo.commands.os.chdir"))
+        yield
+
+
+class _ScratchDirTestCase(unittest.TestCase):
+    """Run each test in its own directory under the module scratch root."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.tmpdir)
-
-    def tearDown(self):
-        os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
-    def _mock_devcontainer_calls(self):
-        """Create mocks for devcontainer commands."""
-        return mock.patch.multiple(
-            "_jolo.commands",
-            devcontainer_up=mock.DEFAULT,
-            devcontainer_exec_command=mock.DEFAULT,
-            devcontainer_exec_tmux=mock.DEFAULT,
-            is_container_running=mock.DEFAULT,
-            setup_credential_cache=mock.DEFAULT,
-            setup_emacs_config=mock.DEFAULT,
-            get_secrets=mock.Mock(return_value={}),
-        )
-
-    def test_create_with_flavor_uses_provided_flavors(self):
-        """create with --flavor should use the provided flavors."""
-        args = jolo.parse_args(
-            [
-                "create",
-                "testproj",
-                "--flavor",
-                "python-web,typescript",
-                "-d",
-            ]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
+        self.tmpdir = os.path.join(_BASE.name, self.id())
+        os.mkdir(self.tmpdir)
+        # The tree itself goes in one sweep in tearDownModule
+        self.enterContext(in_dir(self.tmpdir))
+
+    def assert_files_exist(self, root, *relpaths):
+        """Check relpaths under root, listing each directory only once."""
+        listings = {}
+        for relpath in relpaths:
+            parent, name = os.path.split(relpath)
+            if parent not in listings:
+                try:
+                    listings[parent] = set(os.listdir(root / parent))
+                except FileNotFoundError:
+                    listings[parent] = set()
+            with self.subTest(relpath=relpath):
+                self.assertIn(name, listings[parent], f"{relpath} missing")
+
+    def assert_test_hooks_installed(self, script):
+        """Pre-commit hooks and the test-hook defaults were set up."""
+        for expected in (
+            "pre-commit install --hook-type pre-commit --hook-type pre-push",
+            "git config --local hooks.test-on-commit true",
+            "git config --local hooks.test-on-push false",
+        ):
+            self.assertIn(expected, script)
+
+
+class TestCreateModeFlavorIntegration(_ScratchDirTestCase):
+    """Integration tests for run_create_mode() flavor handling."""
 
-        project_path = Path(self.tmpdir) / "testproj"
+    @classmethod
+    def setUpClass(cls):
+        """Patch the devcontainer calls once for the whole class."""
+        super().setUpClass()
+        # Plain Mocks: nothing here is used as a context manager or
+        # container, so MagicMock's magic-method setup is wasted
+        cls.mocks = {
+            name: mock.Mock()
+            for name in (
+                "devcontainer_up",
+                "devcontainer_exec_command",
+                "devcontainer_exec_tmux",
+                "is_container_running",
+                "setup_credential_cache",
+                "setup_emacs_config",
+                "get_secrets",
+            )
+        }
+        patcher = mock.patch.multiple("_jolo.commands", **cls.mocks)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        # flavor spec -> (project path, exec calls); see _scaffold()
+        cls._scaffolds = {}
+        # path -> text; scaffolded trees are read-only
+        cls._files = {}
 
-        precommit_config = project_path / ".pre-commit-config.yaml"
-        self.assertTrue(precommit_config.exists())
-        content = precommit_config.read_text()
-        self.assertIn("ruff", content)  # Python
-        self.assertIn("biome", content)  # TypeScript
+    def setUp(self):
+        super().setUp()
+        for m in self.mocks.values():
+            m.reset_mock(return_value=True, side_effect=True)
+        self.mocks["devcontainer_up"].return_value = True
+        self.mocks["get_secrets"].return_value = {}
+
+    def _scaffold(self, spec):
+        """Run create for a flavor spec once per class, then reuse it.
+
+        Returns (project path, exec_script() of the container calls). Tests
+        share the tree as-is instead of getting a copy, so they must
+        treat it as read-only.
+        """
+        if spec not in self._scaffolds:
+            workdir = os.path.join(_BASE.name, f"scaffold-{spec}")
+            os.mkdir(workdir)
+            # The mock is shared by every scaffold in this test; keep only
+            # the calls made by this run
+            exec_mock = self.mocks["devcontainer_exec_command"]
+            start = len(exec_mock.call_args_list)
+            with in_dir(workdir):
+                jolo.run_create_mode(create_args(spec))
+            script = exec_script(exec_mock, start)
+            self._scaffolds[spec] = (Path(workdir) / "testproj", script)
+        return self._scaffolds[spec]
+
+    def read(self, path):
+        """Text of a scaffolded file, read from disk at most once.
+
+        A missing file fails the test; no separate exists() check needed.
+        """
+        if path not in self._files:
+            try:
+                self._files[path] = path.read_text()
+            except FileNotFoundError:
+                self.fail(f"{path} missing")
+        return self._files[path]
+
+    def scaffold(self, spec):
+        """Project path scaffolded for spec."""
+        return self._scaffold(spec)[0]
+
+    def exec_script(self, spec):
+        """Commands run in the container while scaffolding spec."""
+        return self._scaffold(spec)[1]
+
+    def assert_expected(self, spec):
+        """create for spec writes EXPECTED[spec] with the listed contents."""
+        project_path = self.scaffold(spec)
+        for relpath, needles in EXPECTED[spec].items():
+            with self.subTest(relpath=relpath):
+                content = self.read(project_path / relpath)
+                for needle in needles:
+                    self.assertIn(needle, content)
+
+    def test_create_go_web_dev_skips_templ_watcher(self):
+        """go-web's justfile runs air alone, no background templ watcher."""
+        justfile = self.scaffold("go-web") / "justfile"
+        self.assertNotIn("templ generate --watch", self.read(justfile))
 
     def test_create_without_flavor_calls_interactive_selector(self):
         """create without --flavor should call select_flavors_interactive."""
-        args = jolo.parse_args(["create", "testproj", "-d"])
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            with mock.patch(
-                "_jolo.commands.select_flavors_interactive",
-                return_value=["go"],
-            ) as mock_selector:
-                jolo.run_create_mode(args)
-                mock_selector.assert_called_once()
-
-        project_path = Path(self.tmpdir) / "testproj"
+        args = create_args()
 
-        precommit_config = project_path / ".pre-commit-config.yaml"
-        self.assertTrue(precommit_config.exists())
-        content = precommit_config.read_text()
-        self.assertIn("golangci-lint", content)  # Go
-
-    def test_create_generates_precommit_config(self):
-        """create should generate .pre-commit-config.yaml based on flavors."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "rust", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-        precommit_config = project_path / ".pre-commit-config.yaml"
-
-        self.assertTrue(precommit_config.exists())
-        content = precommit_config.read_text()
-        self.assertIn("cargo-check", content)
-        self.assertIn("fmt", content)
-        self.assertIn("trailing-whitespace", content)
-        self.assertIn("gitleaks", content)
-
-    def test_create_copies_gitignore_from_templates(self):
-        """create should copy .gitignore from templates/."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "python", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
+        with mock.patch(
+            "_jolo.commands.select_flavors_interactive",
+            return_value=["go"],
+        ) as mock_selector:
             jolo.run_create_mode(args)
+            mock_selector.assert_called_once()
 
         project_path = Path(self.tmpdir) / "testproj"
-        gitignore = project_path / ".gitignore"
 
-        self.assertTrue(gitignore.exists())
+        precommit_config = project_path / ".pre-commit-config.yaml"
+        content = self.read(precommit_config)
+        self.assertIn("golangci-lint", content)  # Go
 
     def test_create_copies_perf_rig_template(self):
         """create should drop a perf-rig.toml with project identity filled
         and target.url left as ${DEV_HOST}:${PORT} so no hostname ever
         lands in a committed file."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "python", "-d"]
-        )
+        project_path = self.scaffold("python")
 
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        perf_rig = Path(self.tmpdir) / "testproj" / "perf-rig.toml"
-        self.assertTrue(perf_rig.exists())
-        content = perf_rig.read_text()
+        perf_rig = project_path / "perf-rig.toml"
+        content = self.read(perf_rig)
         self.assertIn("schema_version = 1", content)
         self.assertIn('name = "testproj"', content)
         self.assertIn('language = "python"', content)
@@ -140,364 +324,71 @@ class TestCreateModeFlavorIntegration(unittest.TestCase):
         self.assertNotIn("{{PROJECT_LANGUAGE}}", content)
 
         # The filled content must be valid TOML.
-        import tomllib
-
         data = tomllib.loads(content)
         self.assertEqual(data["project"]["name"], "testproj")
         self.assertEqual(data["project"]["language"], "python")
 
-    def test_create_copies_editorconfig_from_templates(self):
-        """create should copy .editorconfig from templates/."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "python", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-        editorconfig = project_path / ".editorconfig"
-
-        self.assertTrue(editorconfig.exists())
-
     def test_create_runs_init_commands_for_primary_flavor(self):
         """create should run project init commands for primary flavor."""
-        args = jolo.parse_args(
-            [
-                "create",
-                "testproj",
-                "--flavor",
-                "python,typescript-web",
-                "-d",
-            ]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-            exec_calls = mocks["devcontainer_exec_command"].call_args_list
-            mkdir_called = any(
-                "mkdir -p tests" in str(call) for call in exec_calls
-            )
-            self.assertTrue(
-                mkdir_called,
-                f"Expected 'mkdir -p tests' to be called, got: {exec_calls}",
-            )
+        script = self.exec_script("python,typescript-web")
+        self.assertIn("mkdir -p tests", script)
 
     def test_create_writes_test_framework_config_for_python(self):
         """create with python should write pytest config to pyproject.toml."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "python", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
+        project_path = self.scaffold("python")
         pyproject = project_path / "pyproject.toml"
 
         if pyproject.exists():
-            content = pyproject.read_text()
+            content = self.read(pyproject)
             self.assertIn("pytest", content.lower())
 
     def test_create_installs_test_hooks(self):
         """create should install pre-commit hooks and set test defaults."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "python", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-            exec_calls = mocks["devcontainer_exec_command"].call_args_list
-            install_called = any(
-                "pre-commit install --hook-type pre-commit --hook-type pre-push"
-                in str(call)
-                for call in exec_calls
-            )
-            commit_default = any(
-                "git config --local hooks.test-on-commit true" in str(call)
-                for call in exec_calls
-            )
-            push_default = any(
-                "git config --local hooks.test-on-push false" in str(call)
-                for call in exec_calls
-            )
-
-            self.assertTrue(
-                install_called,
-                f"Expected pre-commit install, got: {exec_calls}",
-            )
-            self.assertTrue(
-                commit_default,
-                f"Expected commit default, got: {exec_calls}",
-            )
-            self.assertTrue(
-                push_default,
-                f"Expected push default, got: {exec_calls}",
-            )
-
-    def test_create_writes_test_framework_config_for_typescript(self):
-        """create with typescript should create example test with bun:test."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "typescript", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-        example_test = project_path / "src" / "example.test.ts"
-
-        self.assertTrue(example_test.exists())
-        content = example_test.read_text()
-        self.assertIn("bun:test", content)
-
-    def test_create_writes_type_checker_config_for_typescript_web(self):
-        """create with typescript-web should write tsconfig.json with JSX."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "typescript-web", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-        tsconfig = project_path / "tsconfig.json"
-
-        self.assertTrue(tsconfig.exists())
-        content = tsconfig.read_text()
-        self.assertIn("strict", content)
-        self.assertIn("jsx", content)
+        self.assert_test_hooks_installed(self.exec_script("python"))
 
     def test_create_writes_beth_source_files(self):
         """create with typescript-web should write BETH scaffold files."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "typescript-web", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-        self.assertTrue((project_path / "src" / "index.tsx").exists())
-        self.assertTrue((project_path / "src" / "pages" / "home.tsx").exists())
-        self.assertTrue(
-            (project_path / "src" / "components" / "layout.tsx").exists()
-        )
-        self.assertTrue((project_path / "src" / "styles.css").exists())
-        self.assertTrue((project_path / "public" / ".gitkeep").exists())
-
-    def test_create_first_flavor_is_primary(self):
-        """First flavor in list should be treated as primary for scaffold output."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "go,python", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-        go_mod = project_path / "go.mod"
-        self.assertTrue(
-            go_mod.exists(),
-            "Expected go.mod to be scaffolded when go is the primary flavor",
-        )
-        self.assertIn("module testproj", go_mod.read_text())
+        project_path = self.scaffold("typescript-web")
+        self.assert_files_exist(project_path, *BETH_FILES)
 
     def test_create_empty_flavor_selection_aborts(self):
         """If interactive selector returns empty list, should abort."""
-        args = jolo.parse_args(["create", "testproj", "-d"])
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            with mock.patch(
-                "_jolo.commands.select_flavors_interactive", return_value=[]
-            ):
-                with self.assertRaises(SystemExit):
-                    jolo.run_create_mode(args)
-
-    def test_create_go_web_scaffold_files(self):
-        """create with go-web should write main.go, templ components, and justfile."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "go-web", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-
-        # main.go with /api/greet handler
-        main_go = project_path / "main.go"
-        self.assertTrue(main_go.exists())
-        content = main_go.read_text()
-        self.assertIn("handleHome", content)
-        self.assertIn("handleGreet", content)
-        self.assertIn("/api/greet", content)
-        self.assertIn('"testproj/components"', content)
-        self.assertIn("net/http/pprof", content)
-        self.assertIn("/debug/pprof/", content)
-
-        # templ components
-        page_templ = project_path / "components" / "page.templ"
-        home_templ = project_path / "components" / "home.templ"
-        self.assertTrue(page_templ.exists())
-        self.assertTrue(home_templ.exists())
-        self.assertIn('href="#main"', page_templ.read_text())
-        self.assertIn('<main id="main">', home_templ.read_text())
-
-        # justfile with air-only dev command (no background templ watcher)
-        justfile = project_path / "justfile"
-        self.assertTrue(justfile.exists())
-        jf_content = justfile.read_text()
-        self.assertIn("air", jf_content)
-        self.assertNotIn("templ generate --watch", jf_content)
-        self.assertTrue((project_path / ".envrc").exists())
-        self.assertIn("APP_PROFILE=1", (project_path / ".envrc").read_text())
+        args = create_args()
 
-        # .air.toml drives templ generation + app rebuild
-        air_toml = project_path / ".air.toml"
-        self.assertTrue(air_toml.exists())
-        air_content = air_toml.read_text()
-        self.assertIn("templ generate && go build", air_content)
-        self.assertIn('entrypoint = ["./tmp/main"]', air_content)
-        self.assertIn('exclude_regex = [".*_templ.go"]', air_content)
-
-        # static dir
-        self.assertTrue((project_path / "static" / ".gitkeep").exists())
-
-    def test_create_python_web_scaffold_files(self):
-        """create with python-web should write FastAPI app, templates, and justfile."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "python-web", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-
-        # app.py with FastAPI
-        app_py = project_path / "src" / "testproj" / "app.py"
-        self.assertTrue(app_py.exists())
-        content = app_py.read_text()
-        self.assertIn("FastAPI", content)
-        self.assertIn("Jinja2Templates", content)
-        self.assertIn("pyinstrument", content)
-        self.assertIn('request.query_params.get("profile")', content)
-
-        # main.py with uvicorn
-        main_py = project_path / "src" / "testproj" / "main.py"
-        self.assertTrue(main_py.exists())
-        main_content = main_py.read_text()
-        self.assertIn("uvicorn", main_content)
-        self.assertIn("testproj.app:app", main_content)
-
-        # Jinja2 templates
-        self.assertTrue((project_path / "templates" / "base.html").exists())
-        self.assertTrue((project_path / "templates" / "home.html").exists())
-        base_html = (project_path / "templates" / "base.html").read_text()
-        self.assertIn("htmx", base_html)
-        self.assertIn('href="#main"', base_html)
-
-        # pyproject.toml with FastAPI deps
-        pyproject = project_path / "pyproject.toml"
-        self.assertTrue(pyproject.exists())
-        pyp_content = pyproject.read_text()
-        self.assertIn("fastapi", pyp_content)
-        self.assertIn("uvicorn", pyp_content)
-        self.assertIn("jinja2", pyp_content)
-
-        # justfile with uvicorn dev server
-        justfile = project_path / "justfile"
-        self.assertTrue(justfile.exists())
-        jf_content = justfile.read_text()
-        self.assertIn("uvicorn", jf_content)
-        self.assertIn("--reload", jf_content)
-        self.assertTrue((project_path / ".envrc").exists())
-        self.assertIn("APP_PROFILE=1", (project_path / ".envrc").read_text())
-
-        # static dir
-        self.assertTrue((project_path / "static" / ".gitkeep").exists())
-
-    def test_create_rust_web_scaffold_files(self):
-        """create with rust-web should write pprof-enabled scaffold files."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "rust-web", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-        main_rs = project_path / "src" / "main.rs"
-        self.assertTrue(main_rs.exists())
-        content = main_rs.read_text()
-        self.assertIn('"/debug/pprof/profile"', content)
-        self.assertIn("ProfilerGuard", content)
-        self.assertTrue((project_path / ".envrc").exists())
-        self.assertIn("APP_PROFILE=1", (project_path / ".envrc").read_text())
-
-    def test_create_typescript_web_profiles_via_inspector(self):
-        """create with typescript-web should enable Bun inspector in dev."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "typescript-web", "-d"]
-        )
-
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
-
-        project_path = Path(self.tmpdir) / "testproj"
-        justfile = project_path / "justfile"
-        self.assertTrue(justfile.exists())
-        content = justfile.read_text()
-        self.assertIn("--inspect=0.0.0.0:$(($PORT + 1000))", content)
-        self.assertTrue((project_path / ".envrc").exists())
-        self.assertIn("APP_PROFILE=1", (project_path / ".envrc").read_text())
+        with mock.patch(
+            "_jolo.commands.select_flavors_interactive", return_value=[]
+        ):
+            with self.assertRaises(SystemExit):
+                jolo.run_create_mode(args)
 
     def test_create_template_files_are_copied(self):
-        """create should copy AGENTS.md, CLAUDE.md, GEMINI.md from templates."""
-        args = jolo.parse_args(
-            ["create", "testproj", "--flavor", "python", "-d"]
-        )
+        """create should copy the dotfiles and agent docs from templates/."""
+        project_path = self.scaffold("python")
 
-        with self._mock_devcontainer_calls() as mocks:
-            mocks["devcontainer_up"].return_value = True
-            jolo.run_create_mode(args)
+        self.assert_files_exist(project_path, *TEMPLATE_FILES)
 
-        project_path = Path(self.tmpdir) / "testproj"
 
-        for filename in ["AGENTS.md", "CLAUDE.md", "GEMINI.md"]:
-            filepath = project_path / filename
-            self.assertTrue(filepath.exists(), f"Expected {filename} to exist")
+def _expected_test(spec):
+    def test(self):
+        self.assert_expected(spec)
 
+    test.__doc__ = f"create --flavor {spec} writes EXPECTED[{spec!r}]."
+    return test
 
-class TestInitModeIntegration(unittest.TestCase):
-    """Integration tests for run_init_mode()."""
 
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.tmpdir)
+# One test per EXPECTED spec, so `-k <flavor>` scaffolds only that flavor
+# and one failing create doesn't hide the others
+for _spec in EXPECTED:
+    setattr(
+        TestCreateModeFlavorIntegration,
+        "test_create_" + _spec.replace(",", "_").replace("-", "_"),
+        _expected_test(_spec),
+    )
+del _spec
 
-    def tearDown(self):
-        os.chdir(self.original_cwd)
-        import shutil
 
-        shutil.rmtree(self.tmpdir)
+class TestInitModeIntegration(_ScratchDirTestCase):
+    """Integration tests for run_init_mode()."""
 
     def test_init_installs_test_hooks(self):
         """init should install pre-commit hooks and set test defaults."""
@@ -509,47 +400,21 @@ class TestInitModeIntegration(unittest.TestCase):
             return result
 
         with mock.patch("_jolo.commands.subprocess.run", side_effect=mock_run):
-            with mock.patch.multiple(
-                "_jolo.commands",
-                devcontainer_up=mock.DEFAULT,
-                devcontainer_exec_command=mock.DEFAULT,
-                devcontainer_exec_tmux=mock.DEFAULT,
-                scaffold_devcontainer=mock.DEFAULT,
-                setup_credential_cache=mock.DEFAULT,
-                setup_notification_hooks=mock.DEFAULT,
-                setup_emacs_config=mock.DEFAULT,
-                get_secrets=mock.DEFAULT,
-            ) as mocks:
-                mocks["get_secrets"].return_value = {}
-                mocks["devcontainer_up"].return_value = True
+            mocks = {
+                "devcontainer_up": mock.Mock(return_value=True),
+                "devcontainer_exec_command": mock.Mock(),
+                "devcontainer_exec_tmux": mock.Mock(),
+                "scaffold_devcontainer": mock.Mock(),
+                "setup_credential_cache": mock.Mock(),
+                "setup_notification_hooks": mock.Mock(),
+                "setup_emacs_config": mock.Mock(),
+                "get_secrets": mock.Mock(return_value={}),
+            }
+            with mock.patch.multiple("_jolo.commands", **mocks):
                 jolo.run_init_mode(args)
 
-                exec_calls = mocks["devcontainer_exec_command"].call_args_list
-                install_called = any(
-                    "pre-commit install --hook-type pre-commit --hook-type pre-push"
-                    in str(call)
-                    for call in exec_calls
-                )
-                commit_default = any(
-                    "git config --local hooks.test-on-commit true" in str(call)
-                    for call in exec_calls
-                )
-                push_default = any(
-                    "git config --local hooks.test-on-push false" in str(call)
-                    for call in exec_calls
-                )
-
-                self.assertTrue(
-                    install_called,
-                    f"Expected pre-commit install, got: {exec_calls}",
-                )
-                self.assertTrue(
-                    commit_default,
-                    f"Expected commit default, got: {exec_calls}",
-                )
-                self.assertTrue(
-                    push_default,
-                    f"Expected push default, got: {exec_calls}",
+                self.assert_test_hooks_installed(
+                    exec_script(mocks["devcontainer_exec_command"])
                 )
 
 
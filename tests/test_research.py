@@ -1,45 +1,107 @@
 #!/usr/bin/env python3
 """Tests for jolo research command."""
 
+import argparse
 import os
 import tempfile
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest import mock
 
 import jolo
+from _jolo import commands as _cmds
+from _jolo.commands import _build_research_agent_cmd, _resolve_research_prompt
 
 FAKE_DT = datetime(2026, 2, 11, 14, 30, 45, tzinfo=timezone.utc)
+RESEARCH_HOME = Path("/tmp/fake-research")
+
+# Read-only load_config() stand-ins; build a new dict to vary one
+CFG_CLAUDE_GEMINI = MappingProxyType(
+    {
+        "agents": ("claude", "gemini"),
+        "agent_commands": MappingProxyType(
+            {
+                "claude": (
+                    "env -u ANTHROPIC_API_KEY claude "
+                    "--dangerously-skip-permissions"
+                ),
+                "gemini": "gemini",
+            }
+        ),
+    }
+)
+CFG_WITH_CODEX = MappingProxyType(
+    {
+        **CFG_CLAUDE_GEMINI,
+        "agent_commands": MappingProxyType(
+            {
+                **CFG_CLAUDE_GEMINI["agent_commands"],
+                "codex": "codex --dangerously-bypass-approvals-and-sandbox",
+            }
+        ),
+    }
+)
+CFG_EMPTY = MappingProxyType(
+    {"agents": (), "agent_commands": MappingProxyType({})}
+)
+CFG_DEEP = MappingProxyType(
+    {
+        "agents": ("claude", "gemini", "codex"),
+        "agent_commands": MappingProxyType(
+            {
+                "claude": "claude --dangerously-skip-permissions",
+                "gemini": "gemini --yolo",
+                "codex": "codex --dangerously-bypass-approvals-and-sandbox",
+            }
+        ),
+    }
+)
 
+# One parsed bare `research`; see research_args()
+_RESEARCH_ARGS = jolo.parse_args(["research"])
 
-class TestResearchArgParsing(unittest.TestCase):
-    """Test CLI argument parsing for research subcommand."""
 
-    def test_research_command(self):
-        args = jolo.parse_args(["research", "my topic"])
-        self.assertEqual(args.command, "research")
-        self.assertEqual(args.prompt, "my topic")
+def research_args(**fields):
+    """Fresh `research` args with fields overridden, skipping argparse."""
+    return argparse.Namespace(**{**vars(_RESEARCH_ARGS), **fields})
 
-    def test_research_prompt_optional(self):
-        args = jolo.parse_args(["research"])
-        self.assertIsNone(args.prompt)
 
-    def test_research_file_flag(self):
-        args = jolo.parse_args(["research", "--file", "notes.txt"])
-        self.assertEqual(args.file, "notes.txt")
+_BASE = None
 
-    def test_research_agent_default(self):
-        args = jolo.parse_args(["research", "topic"])
-        self.assertIsNone(args.agent)
 
-    def test_research_agent_override(self):
-        args = jolo.parse_args(["research", "--agent", "gemini", "topic"])
-        self.assertEqual(args.agent, "gemini")
+def setUpModule():
+    """One scratch root for the module, removed in a single sweep."""
+    global _BASE
+    _BASE = tempfile.TemporaryDirectory()
+
+
+def tearDownModule():
+    _BASE.cleanup()
 
-    def test_research_verbose_flag(self):
-        args = jolo.parse_args(["research", "-v", "topic"])
-        self.assertTrue(args.verbose)
+
+class TestResearchArgParsing(unittest.TestCase):
+    """Test CLI argument parsing for research subcommand."""
+
+    # (argv, attribute, expected value)
+    CASES = (
+        (["research", "my topic"], "command", "research"),
+        (["research", "my topic"], "prompt", "my topic"),
+        (["research"], "prompt", None),
+        (["research", "--file", "notes.txt"], "file", "notes.txt"),
+        (["research", "topic"], "agent", None),
+        (["research", "--agent", "gemini", "topic"], "agent", "gemini"),
+        (["research", "-v", "topic"], "verbose", True),
+        (["research", "--deep", "topic"], "deep", True),
+        (["research", "topic"], "deep", False),
+    )
+
+    def test_parse(self):
+        for argv, attr, expected in self.CASES:
+            with self.subTest(argv=argv, attr=attr):
+                args = jolo.parse_args(argv)
+                self.assertEqual(getattr(args, attr), expected)
 
     def test_research_all_flags(self):
         args = jolo.parse_args(
@@ -56,185 +118,151 @@ class TestResearchArgParsing(unittest.TestCase):
         self.assertEqual(args.agent, "claude")
         self.assertTrue(args.verbose)
 
-    def test_research_deep_flag(self):
-        args = jolo.parse_args(["research", "--deep", "topic"])
-        self.assertTrue(args.deep)
-
-    def test_research_deep_default_false(self):
-        args = jolo.parse_args(["research", "topic"])
-        self.assertFalse(args.deep)
-
 
 class TestSlugifyPrompt(unittest.TestCase):
     """Test slugify_prompt utility."""
 
-    def test_simple_prompt(self):
-        self.assertEqual(
-            jolo.slugify_prompt("what is an apple"), "what-is-an-apple"
-        )
-
-    def test_special_characters(self):
-        self.assertEqual(
-            jolo.slugify_prompt("what's a C++ compiler?"),
-            "what-s-a-c-compiler",
-        )
-
-    def test_leading_trailing_stripped(self):
-        self.assertEqual(jolo.slugify_prompt("  hello world  "), "hello-world")
+    # (prompt, expected slug)
+    CASES = (
+        ("what is an apple", "what-is-an-apple"),
+        ("what's a C++ compiler?", "what-s-a-c-compiler"),
+        ("  hello world  ", "hello-world"),
+        ("", "research"),
+        ("!!!???", "research"),
+        ("Hello World", "hello-world"),
+        ("python 3.12 features", "python-3-12-features"),
+        # non-ASCII letters are separators too
+        ("naïve café", "na-ve-caf"),
+    )
+
+    def test_slugify(self):
+        for prompt, expected in self.CASES:
+            with self.subTest(prompt=prompt):
+                self.assertEqual(jolo.slugify_prompt(prompt), expected)
 
     def test_truncation(self):
-        long_prompt = "a " * 40
-        slug = jolo.slugify_prompt(long_prompt, max_len=10)
-        self.assertLessEqual(len(slug), 10)
-        self.assertFalse(slug.endswith("-"))
-
-    def test_truncation_breaks_at_hyphen(self):
-        slug = jolo.slugify_prompt("alpha-beta-gamma-delta", max_len=15)
-        self.assertLessEqual(len(slug), 15)
-        self.assertFalse(slug.endswith("-"))
-
-    def test_empty_prompt_returns_research(self):
-        self.assertEqual(jolo.slugify_prompt(""), "research")
-
-    def test_all_special_chars_returns_research(self):
-        self.assertEqual(jolo.slugify_prompt("!!!???"), "research")
-
-    def test_uppercase_lowered(self):
-        self.assertEqual(jolo.slugify_prompt("Hello World"), "hello-world")
-
-    def test_numbers_preserved(self):
-        self.assertEqual(
-            jolo.slugify_prompt("python 3.12 features"), "python-3-12-features"
-        )
+        for prompt, max_len in (
+            ("a " * 40, 10),
+            # breaks at a hyphen
+            ("alpha-beta-gamma-delta", 15),
+        ):
+            with self.subTest(prompt=prompt):
+                slug = jolo.slugify_prompt(prompt, max_len=max_len)
+                self.assertLessEqual(len(slug), max_len)
+                self.assertFalse(slug.endswith("-"))
 
 
 class TestEnsureResearchRepo(unittest.TestCase):
     """Test ensure_research_repo creation logic."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = os.path.join(_BASE.name, self.id())
+        os.mkdir(self.tmpdir)
+        self.research_home = Path(self.tmpdir) / "research"
+        self.config = {"research_home": str(self.research_home)}
+        # git goes through the runner; keep the scaffold out of every test
+        self.mock_run = mock.Mock()
+        self.mock_scaffold = self.enterContext(
+            mock.patch.object(_cmds, "scaffold_devcontainer")
+        )
 
-    def tearDown(self):
-        import shutil
+    def ensure(self):
+        return jolo.ensure_research_repo(self.config, runner=self.mock_run)
 
-        shutil.rmtree(self.tmpdir)
+    def make_repo(self, devcontainer=True):
+        """Pre-existing research repo; devcontainer=False is a partial init."""
+        (self.research_home / ".git").mkdir(parents=True)
+        if devcontainer:
+            devcontainer_dir = self.research_home / ".devcontainer"
+            devcontainer_dir.mkdir()
+            (devcontainer_dir / "devcontainer.json").write_bytes(b"{}")
 
     def test_returns_existing_repo(self):
-        research_home = Path(self.tmpdir) / "research"
-        research_home.mkdir()
-        (research_home / ".git").mkdir()
-        devcontainer_dir = research_home / ".devcontainer"
-        devcontainer_dir.mkdir()
-        (devcontainer_dir / "devcontainer.json").write_text("{}")
+        self.make_repo()
 
-        config = {"research_home": str(research_home)}
-        result = jolo.ensure_research_repo(config)
-        self.assertEqual(result, research_home)
+        result = self.ensure()
+        self.assertEqual(result, self.research_home)
 
-    @mock.patch("_jolo.commands.scaffold_devcontainer")
-    @mock.patch("_jolo.commands.subprocess.run")
-    def test_recreates_after_partial_init(self, mock_run, mock_scaffold):
-        research_home = Path(self.tmpdir) / "broken"
-        research_home.mkdir()
-        (research_home / ".git").mkdir()
-        # No .devcontainer — incomplete
+    def test_recreates_after_partial_init(self):
+        self.make_repo(devcontainer=False)
 
-        config = {"research_home": str(research_home)}
-        jolo.ensure_research_repo(config)
+        self.ensure()
 
-        mock_scaffold.assert_called_once()
+        self.mock_scaffold.assert_called_once()
 
-    @mock.patch("_jolo.commands.scaffold_devcontainer")
-    @mock.patch("_jolo.commands.subprocess.run")
-    def test_creates_new_repo(self, mock_run, mock_scaffold):
-        research_home = Path(self.tmpdir) / "new-research"
-        config = {"research_home": str(research_home)}
+    def test_creates_new_repo(self):
+        result = self.ensure()
 
-        result = jolo.ensure_research_repo(config)
-
-        self.assertEqual(result, research_home)
-        self.assertTrue(research_home.exists())
+        self.assertEqual(result, self.research_home)
+        self.assertTrue(self.research_home.exists())
 
         # git init, git add, git commit
-        git_calls = [c[0][0] for c in mock_run.call_args_list]
+        git_calls = [c.args[0] for c in self.mock_run.call_args_list]
         self.assertEqual(git_calls[0], ["git", "init"])
         self.assertEqual(git_calls[1], ["git", "add", "."])
         self.assertEqual(git_calls[2][0], "git")
         self.assertEqual(git_calls[2][1], "commit")
 
-    @mock.patch("_jolo.commands.scaffold_devcontainer")
-    @mock.patch("_jolo.commands.subprocess.run")
-    def test_scaffolds_devcontainer(self, mock_run, mock_scaffold):
-        research_home = Path(self.tmpdir) / "new-research"
-        config = {"research_home": str(research_home)}
-
-        jolo.ensure_research_repo(config)
+    def test_scaffolds_devcontainer(self):
+        self.ensure()
 
-        mock_scaffold.assert_called_once_with(
-            "research", research_home, config=config
+        self.mock_scaffold.assert_called_once_with(
+            "research", self.research_home, config=self.config
         )
 
-    @mock.patch("_jolo.commands.scaffold_devcontainer")
-    @mock.patch("_jolo.commands.subprocess.run")
-    def test_copies_research_skill(self, mock_run, mock_scaffold):
-        research_home = Path(self.tmpdir) / "new-research"
-        config = {"research_home": str(research_home)}
-
-        jolo.ensure_research_repo(config)
+    def test_copies_research_skill(self):
+        self.ensure()
 
-        skill_dir = research_home / ".jolo" / "skills" / "j-research"
+        skill_dir = self.research_home / ".jolo" / "skills" / "j-research"
         self.assertTrue(skill_dir.exists())
 
 
-class TestResearchMode(unittest.TestCase):
+class _ResearchModeTestCase(unittest.TestCase):
+    """Patch run_research_mode's collaborators once per test."""
+
+    # What load_config() returns; set by subclasses
+    CONFIG = None
+
+    def setUp(self):
+        self.mocks = self.enterContext(
+            mock.patch.multiple(
+                _cmds,
+                load_config=mock.DEFAULT,
+                _setup_container_env=mock.DEFAULT,
+                is_container_running=mock.DEFAULT,
+                devcontainer_up=mock.DEFAULT,
+                devcontainer_exec_command=mock.DEFAULT,
+            )
+        )
+        self.mocks["load_config"].return_value = self.CONFIG
+        self.mocks["is_container_running"].return_value = True
+        self.mocks["devcontainer_up"].return_value = True
+
+    def run_research(self, args):
+        """run_research_mode against RESEARCH_HOME at FAKE_DT."""
+        jolo.run_research_mode(args, research_home=RESEARCH_HOME, now=FAKE_DT)
+
+    def exec_cmd(self):
+        """Command string of the last devcontainer_exec_command call."""
+        return self.mocks["devcontainer_exec_command"].call_args.args[1]
+
+
+class TestResearchMode(_ResearchModeTestCase):
     """Test run_research_mode logic."""
 
     def _make_args(self, prompt="test topic", agent=None):
-        args = jolo.parse_args(["research", prompt])
-        args.agent = agent
-        return args
-
-    def _base_config(self):
-        return {
-            "agents": ["claude", "gemini"],
-            "agent_commands": {
-                "claude": "env -u ANTHROPIC_API_KEY claude --dangerously-skip-permissions",
-                "gemini": "gemini",
-            },
-        }
-
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_exec_command")
-    @mock.patch("_jolo.commands.is_container_running", return_value=True)
-    @mock.patch("_jolo.commands.setup_emacs_config")
-    @mock.patch("_jolo.commands.setup_notification_hooks")
-    @mock.patch("_jolo.commands.setup_credential_cache")
-    @mock.patch("_jolo.commands.get_secrets", return_value={})
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_exec_command_includes_prompt_and_filename(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_secrets,
-        mock_creds,
-        mock_notify,
-        mock_emacs,
-        mock_running,
-        mock_exec,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        mock_config.return_value = self._base_config()
-        research_home = Path("/tmp/fake-research")
-        mock_ensure.return_value = research_home
+        return research_args(prompt=prompt, agent=agent)
 
+    CONFIG = CFG_CLAUDE_GEMINI
+
+    def test_exec_command_includes_prompt_and_filename(self):
         args = self._make_args(prompt="what is an apple", agent="claude")
-        jolo.run_research_mode(args)
+        self.run_research(args)
 
+        mock_exec = self.mocks["devcontainer_exec_command"]
         mock_exec.assert_called_once()
-        call_args = mock_exec.call_args[0]
-        self.assertEqual(call_args[0], research_home)
+        call_args = mock_exec.call_args.args
+        self.assertEqual(call_args[0], RESEARCH_HOME)
         exec_cmd = call_args[1]
         self.assertIn("2026-02-11-1430-what-is-an-apple.org", exec_cmd)
         self.assertIn("/j-research", exec_cmd)
@@ -244,291 +272,149 @@ class TestResearchMode(unittest.TestCase):
         self.assertIn("/tmp/research-", exec_cmd)
         self.assertNotIn("/dev/null", exec_cmd)
 
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_exec_command")
-    @mock.patch("_jolo.commands.is_container_running", return_value=True)
-    @mock.patch("_jolo.commands.setup_emacs_config")
-    @mock.patch("_jolo.commands.setup_notification_hooks")
-    @mock.patch("_jolo.commands.setup_credential_cache")
-    @mock.patch("_jolo.commands.get_secrets", return_value={})
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_uses_explicit_agent(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_secrets,
-        mock_creds,
-        mock_notify,
-        mock_emacs,
-        mock_running,
-        mock_exec,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        mock_config.return_value = self._base_config()
-        mock_ensure.return_value = Path("/tmp/fake-research")
-
-        args = self._make_args(agent="gemini")
-        jolo.run_research_mode(args)
-
-        exec_cmd = mock_exec.call_args[0][1]
-        self.assertIn("gemini", exec_cmd)
-        self.assertIn(" -p ", exec_cmd)
-
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_exec_command")
-    @mock.patch("_jolo.commands.is_container_running", return_value=True)
-    @mock.patch("_jolo.commands.setup_emacs_config")
-    @mock.patch("_jolo.commands.setup_notification_hooks")
-    @mock.patch("_jolo.commands.setup_credential_cache")
-    @mock.patch("_jolo.commands.get_secrets", return_value={})
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_codex_uses_positional_prompt(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_secrets,
-        mock_creds,
-        mock_notify,
-        mock_emacs,
-        mock_running,
-        mock_exec,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        config = self._base_config()
-        config["agent_commands"]["codex"] = (
-            "codex --dangerously-bypass-approvals-and-sandbox"
-        )
-        mock_config.return_value = config
-        mock_ensure.return_value = Path("/tmp/fake-research")
+    def test_locates_research_repo_by_default(self):
+        with mock.patch.object(
+            _cmds, "ensure_research_repo", return_value=RESEARCH_HOME
+        ) as mock_ensure:
+            jolo.run_research_mode(self._make_args(agent="claude"))
 
-        args = self._make_args(agent="codex")
-        jolo.run_research_mode(args)
-
-        exec_cmd = mock_exec.call_args[0][1]
-        self.assertNotIn(" -p ", exec_cmd)
-        # codex uses "exec" subcommand for non-interactive mode
-        self.assertIn(
-            "--dangerously-bypass-approvals-and-sandbox exec ", exec_cmd
+        mock_ensure.assert_called_once_with(CFG_CLAUDE_GEMINI)
+        self.assertEqual(
+            self.mocks["devcontainer_exec_command"].call_args.args[0],
+            RESEARCH_HOME,
         )
 
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_exec_command")
-    @mock.patch("_jolo.commands.is_container_running", return_value=True)
-    @mock.patch("_jolo.commands.setup_emacs_config")
-    @mock.patch("_jolo.commands.setup_notification_hooks")
-    @mock.patch("_jolo.commands.setup_credential_cache")
-    @mock.patch("_jolo.commands.get_secrets", return_value={})
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_empty_agents_falls_back_to_claude(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_secrets,
-        mock_creds,
-        mock_notify,
-        mock_emacs,
-        mock_running,
-        mock_exec,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        mock_config.return_value = {"agents": [], "agent_commands": {}}
-        mock_ensure.return_value = Path("/tmp/fake-research")
-
-        args = self._make_args()
-        jolo.run_research_mode(args)
-
-        exec_cmd = mock_exec.call_args[0][1]
-        self.assertIn("claude", exec_cmd)
-
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_exec_command")
-    @mock.patch("_jolo.commands.devcontainer_up", return_value=True)
-    @mock.patch("_jolo.commands.is_container_running", return_value=False)
-    @mock.patch("_jolo.commands.setup_emacs_config")
-    @mock.patch("_jolo.commands.setup_notification_hooks")
-    @mock.patch("_jolo.commands.setup_credential_cache")
-    @mock.patch("_jolo.commands.get_secrets", return_value={})
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_starts_container_when_not_running(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_secrets,
-        mock_creds,
-        mock_notify,
-        mock_emacs,
-        mock_running,
-        mock_up,
-        mock_exec,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        mock_config.return_value = self._base_config()
-        research_home = Path("/tmp/fake-research")
-        mock_ensure.return_value = research_home
-
-        args = self._make_args(agent="claude")
-        jolo.run_research_mode(args)
-
-        mock_up.assert_called_once_with(research_home)
-        mock_exec.assert_called_once()
-
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_exec_command")
-    @mock.patch("_jolo.commands.devcontainer_up")
-    @mock.patch("_jolo.commands.is_container_running", return_value=True)
-    @mock.patch("_jolo.commands.setup_emacs_config")
-    @mock.patch("_jolo.commands.setup_notification_hooks")
-    @mock.patch("_jolo.commands.setup_credential_cache")
-    @mock.patch("_jolo.commands.get_secrets", return_value={})
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_skips_devcontainer_up_when_running(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_secrets,
-        mock_creds,
-        mock_notify,
-        mock_emacs,
-        mock_running,
-        mock_up,
-        mock_exec,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        mock_config.return_value = self._base_config()
-        mock_ensure.return_value = Path("/tmp/fake-research")
-
-        args = self._make_args(agent="claude")
-        jolo.run_research_mode(args)
-
-        mock_up.assert_not_called()
-
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_up", return_value=False)
-    @mock.patch("_jolo.commands.is_container_running", return_value=False)
-    @mock.patch("_jolo.commands.setup_emacs_config")
-    @mock.patch("_jolo.commands.setup_notification_hooks")
-    @mock.patch("_jolo.commands.setup_credential_cache")
-    @mock.patch("_jolo.commands.get_secrets", return_value={})
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_exits_on_container_failure(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_secrets,
-        mock_creds,
-        mock_notify,
-        mock_emacs,
-        mock_running,
-        mock_up,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        mock_config.return_value = self._base_config()
-        mock_ensure.return_value = Path("/tmp/fake-research")
-
-        args = self._make_args(agent="claude")
-        with self.assertRaises(SystemExit):
-            jolo.run_research_mode(args)
+    def test_agent_command(self):
+        """The agent picked and how the prompt is passed to it."""
+        # (label, --agent, config, substrings present, substrings absent)
+        cases = (
+            (
+                "explicit agent",
+                "gemini",
+                CFG_CLAUDE_GEMINI,
+                ("gemini", " -p "),
+                (),
+            ),
+            (
+                # codex uses "exec" subcommand for non-interactive mode
+                "codex positional prompt",
+                "codex",
+                CFG_WITH_CODEX,
+                ("--dangerously-bypass-approvals-and-sandbox exec ",),
+                (" -p ",),
+            ),
+            (
+                "empty agents falls back to claude",
+                None,
+                CFG_EMPTY,
+                ("claude",),
+                (),
+            ),
+        )
+        for label, agent, config, present, absent in cases:
+            with self.subTest(label):
+                self.mocks["load_config"].return_value = config
+                self.run_research(self._make_args(agent=agent))
+
+                exec_cmd = self.exec_cmd()
+                for needle in present:
+                    self.assertIn(needle, exec_cmd)
+                for needle in absent:
+                    self.assertNotIn(needle, exec_cmd)
+
+    def test_container_startup(self):
+        """devcontainer_up only when stopped; a failed start exits early."""
+        # (label, container running, devcontainer_up result, up called)
+        cases = (
+            ("running", True, True, False),
+            ("stopped", False, True, True),
+            ("start fails", False, False, True),
+        )
+        for label, running, up_ok, up_called in cases:
+            with self.subTest(label):
+                for m in self.mocks.values():
+                    m.reset_mock()
+                self.mocks["is_container_running"].return_value = running
+                self.mocks["devcontainer_up"].return_value = up_ok
+
+                args = self._make_args(agent="claude")
+                if up_ok:
+                    self.run_research(args)
+                else:
+                    with self.assertRaises(SystemExit):
+                        self.run_research(args)
+
+                mock_up = self.mocks["devcontainer_up"]
+                if up_called:
+                    mock_up.assert_called_once_with(RESEARCH_HOME)
+                else:
+                    mock_up.assert_not_called()
+                self.assertEqual(
+                    self.mocks["devcontainer_exec_command"].call_count,
+                    int(up_ok),
+                )
 
 
 class TestResolveResearchPrompt(unittest.TestCase):
     """Test _resolve_research_prompt input modes."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Prompt files for the whole class
+        cls.tmpdir = Path(_BASE.name) / cls.__name__
+        cls.tmpdir.mkdir()
+
     def _make_args(self, prompt=None, file=None):
-        args = jolo.parse_args(["research"] + ([prompt] if prompt else []))
-        args.file = file
-        return args
+        return research_args(prompt=prompt, file=file)
 
     def test_prompt_from_args(self):
-        from _jolo.commands import _resolve_research_prompt
-
         args = self._make_args(prompt="what is rust")
         self.assertEqual(_resolve_research_prompt(args), "what is rust")
 
     def test_prompt_from_file(self):
-        from _jolo.commands import _resolve_research_prompt
-
-        tmpdir = tempfile.mkdtemp()
-        try:
-            f = Path(tmpdir) / "question.txt"
-            f.write_text("how do GPUs work?\n")
-            args = self._make_args(file=str(f))
-            self.assertEqual(
-                _resolve_research_prompt(args), "how do GPUs work?"
-            )
-        finally:
-            import shutil
-
-            shutil.rmtree(tmpdir)
+        f = self.tmpdir / "question.txt"
+        f.write_bytes(b"how do GPUs work?\n")
+        args = self._make_args(file=str(f))
+        self.assertEqual(_resolve_research_prompt(args), "how do GPUs work?")
 
     def test_file_not_found_exits(self):
-        from _jolo.commands import _resolve_research_prompt
-
         args = self._make_args(file="/nonexistent/path.txt")
         with self.assertRaises(SystemExit):
             _resolve_research_prompt(args)
 
     def test_file_takes_priority_over_prompt(self):
-        from _jolo.commands import _resolve_research_prompt
-
-        tmpdir = tempfile.mkdtemp()
-        try:
-            f = Path(tmpdir) / "q.txt"
-            f.write_text("from file")
-            args = self._make_args(prompt="from args", file=str(f))
-            self.assertEqual(_resolve_research_prompt(args), "from file")
-        finally:
-            import shutil
+        f = self.tmpdir / "q.txt"
+        f.write_bytes(b"from file")
+        args = self._make_args(prompt="from args", file=str(f))
+        self.assertEqual(_resolve_research_prompt(args), "from file")
 
-            shutil.rmtree(tmpdir)
+    def fake_editor(self, text):
+        """Runner for an $EDITOR that writes text (bytes) into the file."""
 
-    @mock.patch("_jolo.commands.subprocess.run")
-    def test_editor_fallback(self, mock_run):
-        from _jolo.commands import _resolve_research_prompt
-
-        def write_to_file(cmd, **kwargs):
+        def edit(cmd, **kwargs):
             # cmd is a shell string like "fake-editor /tmp/...txt"
-            tmppath = cmd.split()[-1].strip("'")
-            Path(tmppath).write_text("# comment\neditor question\n")
-            return mock.Mock(returncode=0)
+            Path(cmd.split()[-1].strip("'")).write_bytes(text)
+            return SimpleNamespace(returncode=0)
 
-        mock_run.side_effect = write_to_file
+        self.enterContext(
+            mock.patch.dict(os.environ, {"EDITOR": "fake-editor"})
+        )
+        return edit
 
+    def test_editor_fallback(self):
+        edit = self.fake_editor(b"# comment\neditor question\n")
         args = self._make_args()
-        with mock.patch.dict(os.environ, {"EDITOR": "fake-editor"}):
-            result = _resolve_research_prompt(args)
-        self.assertEqual(result, "editor question")
-
-    @mock.patch("_jolo.commands.subprocess.run")
-    def test_editor_empty_exits(self, mock_run):
-        from _jolo.commands import _resolve_research_prompt
-
-        def write_empty(cmd, **kwargs):
-            tmppath = cmd.split()[-1].strip("'")
-            Path(tmppath).write_text("# only comments\n")
-            return mock.Mock(returncode=0)
-
-        mock_run.side_effect = write_empty
+        self.assertEqual(
+            _resolve_research_prompt(args, runner=edit), "editor question"
+        )
 
+    def test_editor_empty_exits(self):
+        edit = self.fake_editor(b"# only comments\n")
         args = self._make_args()
-        with mock.patch.dict(os.environ, {"EDITOR": "fake-editor"}):
-            with self.assertRaises(SystemExit):
-                _resolve_research_prompt(args)
+        with self.assertRaises(SystemExit):
+            _resolve_research_prompt(args, runner=edit)
 
     def test_visual_takes_priority_over_editor(self):
-        from _jolo.commands import _resolve_research_prompt
-
         args = self._make_args(prompt="test")
         with mock.patch.dict(os.environ, {"VISUAL": "emacs", "EDITOR": "vi"}):
             # With a prompt arg, editor is not invoked — just verify
@@ -537,44 +423,17 @@ class TestResolveResearchPrompt(unittest.TestCase):
             self.assertEqual(_resolve_research_prompt(args), "test")
 
 
-class TestResearchDeep(unittest.TestCase):
+class TestResearchDeep(_ResearchModeTestCase):
     """Test --deep research mode."""
 
-    def _base_config(self):
-        return {
-            "agents": ["claude", "gemini", "codex"],
-            "agent_commands": {
-                "claude": "claude --dangerously-skip-permissions",
-                "gemini": "gemini --yolo",
-                "codex": "codex --dangerously-bypass-approvals-and-sandbox",
-            },
-        }
-
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_exec_command")
-    @mock.patch("_jolo.commands.is_container_running", return_value=True)
-    @mock.patch("_jolo.commands._setup_container_env")
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_deep_launches_compound_command(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_setup,
-        mock_running,
-        mock_exec,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        mock_config.return_value = self._base_config()
-        research_home = Path("/tmp/fake-research")
-        mock_ensure.return_value = research_home
-
-        args = jolo.parse_args(["research", "--deep", "what is rust"])
-        jolo.run_research_mode(args)
+    CONFIG = CFG_DEEP
 
-        mock_exec.assert_called_once()
-        exec_cmd = mock_exec.call_args[0][1]
+    def test_deep_launches_compound_command(self):
+        args = research_args(prompt="what is rust", deep=True)
+        self.run_research(args)
+
+        self.mocks["devcontainer_exec_command"].assert_called_once()
+        exec_cmd = self.exec_cmd()
         # Should contain nohup sh -c wrapper
         self.assertIn("nohup sh -c", exec_cmd)
         # Should reference both agent files
@@ -586,50 +445,26 @@ class TestResearchDeep(unittest.TestCase):
         self.assertIn("synthesis", exec_cmd)
         self.assertIn("gemini", exec_cmd)
 
-    @mock.patch("datetime.datetime", wraps=datetime)
-    @mock.patch("_jolo.commands.devcontainer_exec_command")
-    @mock.patch("_jolo.commands.is_container_running", return_value=True)
-    @mock.patch("_jolo.commands._setup_container_env")
-    @mock.patch("_jolo.commands.ensure_research_repo")
-    @mock.patch("_jolo.commands.load_config")
-    def test_deep_uses_claude_and_codex(
-        self,
-        mock_config,
-        mock_ensure,
-        mock_setup,
-        mock_running,
-        mock_exec,
-        mock_dt,
-    ):
-        mock_dt.now.return_value = FAKE_DT
-        mock_config.return_value = self._base_config()
-        mock_ensure.return_value = Path("/tmp/fake-research")
-
-        args = jolo.parse_args(["research", "--deep", "test topic"])
-        jolo.run_research_mode(args)
-
-        exec_cmd = mock_exec.call_args[0][1]
+    def test_deep_uses_claude_and_codex(self):
+        args = research_args(prompt="test topic", deep=True)
+        self.run_research(args)
+
+        exec_cmd = self.exec_cmd()
         self.assertIn("claude", exec_cmd)
         self.assertIn("codex", exec_cmd)
 
     def test_build_research_agent_cmd_codex(self):
         """codex should use exec subcommand."""
-        from _jolo.commands import _build_research_agent_cmd
-
-        config = self._base_config()
         cmd = _build_research_agent_cmd(
-            config, "codex", "test prompt", "/tmp/log"
+            CFG_DEEP, "codex", "test prompt", "/tmp/log"
         )
         self.assertIn("exec", cmd)
         self.assertNotIn(" -p ", cmd)
 
     def test_build_research_agent_cmd_claude(self):
         """claude should use -p flag."""
-        from _jolo.commands import _build_research_agent_cmd
-
-        config = self._base_config()
         cmd = _build_research_agent_cmd(
-            config, "claude", "test prompt", "/tmp/log"
+            CFG_DEEP, "claude", "test prompt", "/tmp/log"
         )
         self.assertIn(" -p ", cmd)
         self.assertNotIn(" exec ", cmd)
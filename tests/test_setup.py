@@ -18,14 +18,11 @@ class TestTemplateSystem(unittest.TestCase):
     """Test .devcontainer template scaffolding."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_scaffold_devcontainer_creates_directory(self):
         """Should create .devcontainer directory."""
@@ -284,14 +281,11 @@ class TestAddUserMounts(unittest.TestCase):
     """Test add_user_mounts() function."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_add_user_mounts_to_devcontainer_json(self):
         """Mount should be added to mounts array in JSON."""
@@ -299,7 +293,7 @@ class TestAddUserMounts(unittest.TestCase):
         devcontainer_dir = Path(self.tmpdir) / ".devcontainer"
         devcontainer_dir.mkdir()
         json_file = devcontainer_dir / "devcontainer.json"
-        json_file.write_text(json.dumps({"name": "test", "mounts": []}))
+        json_file.write_text('{"name": "test", "mounts": []}')
 
         # Add a mount
         mounts = [
@@ -323,7 +317,7 @@ class TestAddUserMounts(unittest.TestCase):
         devcontainer_dir = Path(self.tmpdir) / ".devcontainer"
         devcontainer_dir.mkdir()
         json_file = devcontainer_dir / "devcontainer.json"
-        json_file.write_text(json.dumps({"name": "test", "mounts": []}))
+        json_file.write_text('{"name": "test", "mounts": []}')
 
         mounts = [{"source": "/data", "target": "/mnt", "readonly": True}]
         jolo.add_user_mounts(json_file, mounts)
@@ -336,9 +330,7 @@ class TestAddUserMounts(unittest.TestCase):
         devcontainer_dir = Path(self.tmpdir) / ".devcontainer"
         devcontainer_dir.mkdir()
         json_file = devcontainer_dir / "devcontainer.json"
-        json_file.write_text(
-            json.dumps({"name": "test", "mounts": ["existing"]})
-        )
+        json_file.write_text('{"name": "test", "mounts": ["existing"]}')
 
         mounts = [
             {"source": "/a", "target": "/mnt/a", "readonly": False},
@@ -354,7 +346,7 @@ class TestAddUserMounts(unittest.TestCase):
         devcontainer_dir = Path(self.tmpdir) / ".devcontainer"
         devcontainer_dir.mkdir()
         json_file = devcontainer_dir / "devcontainer.json"
-        json_file.write_text(json.dumps({"name": "test"}))
+        json_file.write_text('{"name": "test"}')
 
         mounts = [{"source": "/data", "target": "/mnt", "readonly": False}]
         jolo.add_user_mounts(json_file, mounts)
@@ -381,14 +373,11 @@ class TestCopyUserFiles(unittest.TestCase):
     """Test copy_user_files() function."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_file_copied_to_correct_location(self):
         """File should be copied to target location."""
@@ -467,12 +456,7 @@ class TestNotificationHooks(unittest.TestCase):
     """Test setup_notification_hooks() function."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
 
     def _workspace(self):
         """Create workspace with cache dirs mimicking post-credential-setup state."""
@@ -706,12 +690,7 @@ class TestCredentialMountStrategy(unittest.TestCase):
     """Test that Claude credentials use selective mounts, not directory copy."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
 
     def test_credentials_not_copied_to_cache(self):
         """setup_credential_cache() should NOT copy .credentials.json (mounted from host)."""
@@ -828,7 +807,7 @@ class TestPersistentCredentialStore(unittest.TestCase):
     survive .gemini-cache rebuilds across containers."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.home = Path(self.tmpdir) / "home"
         self.home.mkdir(parents=True)
         self.ws = Path(self.tmpdir) / "project"
@@ -836,11 +815,6 @@ class TestPersistentCredentialStore(unittest.TestCase):
         self.store = self.home / ".config" / "jolo"
         self.cache = self.ws / ".devcontainer" / ".gemini-cache"
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def _run(self):
         with mock.patch("pathlib.Path.home", return_value=self.home):
             jolo.setup_credential_cache(self.ws)
@@ -957,12 +931,7 @@ class TestPiLlamaConfig(unittest.TestCase):
     """Test Pi local llama.cpp provider setup."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
 
     def test_writes_llama_provider_and_default_model(self):
         """No strong primary -> llama is the fallback default, plus a worker subagent."""
@@ -1123,12 +1092,7 @@ class TestPatchJsonWithJq(unittest.TestCase):
     """Test jq-based JSON patch helper."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
 
     def test_patch_json_with_jq_writes_output(self):
         """Should write jq output and invoke jq with expected args."""
@@ -1209,14 +1173,9 @@ class TestSyncOneJolonew(unittest.TestCase):
     """_sync_one_file semantics: written / updated / jolonew / unchanged."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.target = Path(self.tmpdir)
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_written_when_absent(self):
         hashes: dict = {}
         result = setup._sync_one_file(
@@ -1371,18 +1330,13 @@ class TestPrecommitConfigSync(unittest.TestCase):
     """
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir) / "demo"
         self.project.mkdir()
         (self.project / "pyproject.toml").write_text(
             "[project]\nname = 'demo'\n"
         )
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_sync_creates_precommit_config_when_missing(self):
         self.assertFalse((self.project / ".pre-commit-config.yaml").exists())
         setup.sync_template_files(self.project)
@@ -1431,15 +1385,10 @@ class TestJoloPostCommitInjection(unittest.TestCase):
     """
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir) / "proj"
         self.project.mkdir()
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def _block(self) -> str:
         # Tests treat the block as opaque content the helper installs;
         # we only assert observable behavior (markers + the perf line).
@@ -1621,18 +1570,13 @@ class TestPerfRigSync(unittest.TestCase):
     overwrites it, default leaves user edits alone (git catches drift)."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir) / "demokrate"
         self.project.mkdir()
         (self.project / "pyproject.toml").write_text(
             "[project]\nname = 'demokrate'\n"
         )
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_sync_regenerates_stale_rig_without_force(self):
         """Edited rigs get a .jolonew; original stays put."""
         (self.project / "perf-rig.toml").write_text(
@@ -1670,18 +1614,13 @@ class TestEnvrcSync(unittest.TestCase):
     """Web projects get a generated .envrc for profiling defaults."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir) / "demokrate"
         self.project.mkdir()
         (self.project / "pyproject.toml").write_text(
             "[project]\nname = 'demokrate'\ndependencies = ['fastapi']\n"
         )
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_sync_creates_envrc_when_missing(self):
         self.assertFalse((self.project / ".envrc").exists())
         setup.sync_template_files(self.project)
@@ -1707,18 +1646,13 @@ class TestSyncJustfileCommon(unittest.TestCase):
     """
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.target = Path(self.tmpdir) / "myproj"
         self.target.mkdir()
         (self.target / "pyproject.toml").write_text(
             "[project]\nname = 'myproj'\n"
         )
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_fresh_project_gets_common(self):
         self.assertFalse((self.target / "justfile.common").exists())
         setup.sync_template_files(self.target)
@@ -1767,15 +1701,10 @@ class TestSyncForceAlwaysOverwrites(unittest.TestCase):
     is a no-op."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.target = Path(self.tmpdir) / "myproj"
         self.target.mkdir()
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_force_overwrites_when_flavor_undetectable(self):
         # No flavor signal — but the user's justfile is broken (duplicate
         # `a11y` recipes). --force must still reset it to the generic
@@ -1811,7 +1740,7 @@ class TestSyncForceAutoStage(unittest.TestCase):
     `git status` and doesn't block commits."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir) / "demo"
         self.project.mkdir()
         (self.project / "pyproject.toml").write_text(
@@ -1838,11 +1767,6 @@ class TestSyncForceAutoStage(unittest.TestCase):
             capture_output=True,
         )
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_force_stages_overwritten_precommit(self):
         # Simulate pre-existing project: write a stale .pre-commit-config.yaml
         # and commit it. Then user --force overwrites it; jolo must stage
@@ -1896,7 +1820,7 @@ class TestSyncMetaFlavor(unittest.TestCase):
     no use for)."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.target = Path(self.tmpdir) / "jolo"
         self.target.mkdir()
         (self.target / "pyproject.toml").write_text(
@@ -1909,11 +1833,6 @@ class TestSyncMetaFlavor(unittest.TestCase):
         # must short-circuit before then.
         (self.target / "templates").mkdir()
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_force_regenerates_justfile_without_shared_import(self):
         # Pre-existing user justfile drifts; --force should reclaim it
         # to the meta template — which has no `import 'justfile.common'`.
@@ -1936,7 +1855,7 @@ class TestElixirFlavorSync(unittest.TestCase):
     """Elixir web projects must keep their Phoenix templates on recreate."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir) / "demo"
         self.project.mkdir()
         (self.project / "mix.exs").write_text(
@@ -1947,11 +1866,6 @@ class TestElixirFlavorSync(unittest.TestCase):
         (self.project / "lib").mkdir()
         (self.project / "lib" / "demo_web").mkdir()
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_force_regenerates_elixir_justfile(self):
         (self.project / "justfile").write_text("# stale\n")
         setup.sync_template_files(self.project, force=True)
@@ -1964,7 +1878,7 @@ class TestMetaSyncSkipsRootTemplates(unittest.TestCase):
     """Meta-project sync must leave root template-owned files alone."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.target = Path(self.tmpdir) / "jolo"
         self.target.mkdir()
         (self.target / "pyproject.toml").write_text(
@@ -1975,11 +1889,6 @@ class TestMetaSyncSkipsRootTemplates(unittest.TestCase):
         (self.target / "_jolo" / "__init__.py").write_text("")
         (self.target / "templates").mkdir()
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_no_force_does_not_overwrite_meta_owned_root_files(self):
         agents = self.target / "AGENTS.md"
         precommit = self.target / ".pre-commit-config.yaml"
@@ -2019,14 +1928,9 @@ class TestEnsureLighthouseRunScript(unittest.TestCase):
     """`scripts/lighthouse-run` ships only for web-flavor projects."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.target = Path(self.tmpdir)
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def test_web_flavor_copies_script(self):
         setup.ensure_lighthouse_run_script(self.target, "typescript-web")
         dst = self.target / "scripts" / "lighthouse-run"
@@ -2059,15 +1963,12 @@ class TestLighthouseRunIntegration(unittest.TestCase):
     script together for web flavors and neither for non-web."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir)
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_typescript_web_gets_script_and_recipe(self):
         (self.project / "package.json").write_text('{"name":"x"}')
@@ -2103,7 +2004,7 @@ class TestEnsureGitignore(unittest.TestCase):
     JOLO_LINE = ".devcontainer/.claude-cache/"
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir)
         self.original_cwd = os.getcwd()
         (self.project / "package.json").write_text('{"name":"x"}')
@@ -2111,9 +2012,6 @@ class TestEnsureGitignore(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def _run(self):
         from _jolo.commands import _ensure_project_template_files
@@ -2156,7 +2054,7 @@ class TestRunUpGatesProjectMutation(unittest.TestCase):
     """Project-tree backfill is gated behind `--recreate`."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.project = Path(self.tmpdir)
         (self.project / ".git").mkdir()
         self.original_cwd = os.getcwd()
@@ -2189,9 +2087,6 @@ class TestRunUpGatesProjectMutation(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def _args(self, *, recreate):
         return argparse.Namespace(
@@ -2241,15 +2136,10 @@ class TestLitellmKeys(unittest.TestCase):
     """Per-project LiteLLM virtual key minting + caching."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.home = Path(self.tmpdir) / "home"
         (self.home / ".config" / "jolo").mkdir(parents=True)
 
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
-
     def _urlopen_returning(self, key):
         class FakeResp:
             def __enter__(self_):
@@ -2353,40 +2243,24 @@ class TestLitellmKeys(unittest.TestCase):
 
         ws = Path(self.tmpdir) / "envproj"
         (ws / ".devcontainer").mkdir(parents=True)
-        with mock.patch("pathlib.Path.home", return_value=self.home):
-            with mock.patch.dict(os.environ, {}, clear=True):
-                with mock.patch.object(
-                    commands,
-                    "get_secrets",
-                    return_value={"LITELLM_MASTER_KEY": "sk-master"},
-                ):
-                    with mock.patch.object(
-                        commands,
-                        "ensure_litellm_project_key",
-                        return_value="sk-proj",
-                    ):
-                        with mock.patch.object(
-                            commands, "setup_credential_cache"
-                        ):
-                            with mock.patch.object(
-                                commands, "setup_notification_hooks"
-                            ):
-                                with mock.patch.object(
-                                    commands, "setup_emacs_config"
-                                ):
-                                    with mock.patch.object(
-                                        commands, "setup_stash"
-                                    ):
-                                        with mock.patch.object(
-                                            commands, "sync_skill_templates"
-                                        ):
-                                            commands._setup_container_env(
-                                                ws,
-                                                DEFAULT_CONFIG,
-                                            )
-                        self.assertEqual(
-                            os.environ.get("LITELLM_VIRTUAL_KEY"), "sk-proj"
-                        )
+        with (
+            mock.patch("pathlib.Path.home", return_value=self.home),
+            mock.patch.dict(os.environ, {}, clear=True),
+            mock.patch.multiple(
+                commands,
+                get_secrets=mock.Mock(
+                    return_value={"LITELLM_MASTER_KEY": "sk-master"}
+                ),
+                ensure_litellm_project_key=mock.Mock(return_value="sk-proj"),
+                setup_credential_cache=mock.DEFAULT,
+                setup_notification_hooks=mock.DEFAULT,
+                setup_emacs_config=mock.DEFAULT,
+                setup_stash=mock.DEFAULT,
+                sync_skill_templates=mock.DEFAULT,
+            ),
+        ):
+            commands._setup_container_env(ws, DEFAULT_CONFIG)
+            self.assertEqual(os.environ.get("LITELLM_VIRTUAL_KEY"), "sk-proj")
 
 
 class TestContainerEnvKeys(unittest.TestCase):
@@ -2427,12 +2301,7 @@ class TestPiGatewayConfig(unittest.TestCase):
     """pi provider routes the cloud primary through the host LiteLLM gateway."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
 
     def test_writes_gateway_provider_with_virtual_key(self):
         ws = Path(self.tmpdir) / "project"
@@ -2526,12 +2395,7 @@ class TestPiCodexWorker(unittest.TestCase):
     """pi delegates hard coding to a gateway-served codex specialist subagent."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
 
     def _run(self, cfg, env):
         ws = Path(self.tmpdir) / "project"
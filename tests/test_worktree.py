@@ -30,14 +30,11 @@ class TestModeValidation(unittest.TestCase):
     """Test validation for different modes."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_tree_mode_requires_git_repo(self):
         """--tree should fail if not in git repo."""
@@ -94,14 +91,11 @@ class TestWorktreeDevcontainer(unittest.TestCase):
     """Test worktree-specific devcontainer configuration."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_add_git_mount_to_devcontainer(self):
         """Should add mount for main repo .git directory."""
@@ -150,14 +144,11 @@ class TestListWorktrees(unittest.TestCase):
     """Test worktree listing functionality."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_list_worktrees_empty_on_non_git(self):
         """Should return empty list for non-git directory."""
@@ -232,7 +223,7 @@ class TestBranchExists(unittest.TestCase):
     """Test branch existence checking."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
         # Set up a git repo with a commit
         subprocess.run(["git", "init"], cwd=self.tmpdir, capture_output=True)
@@ -258,9 +249,6 @@ class TestBranchExists(unittest.TestCase):
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_branch_exists_for_existing_branch(self):
         """Should return True for existing branch."""
@@ -277,14 +265,11 @@ class TestFindStaleWorktrees(unittest.TestCase):
     """Test stale worktree detection."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = self.enterContext(tempfile.TemporaryDirectory())
         self.original_cwd = os.getcwd()
 
     def tearDown(self):
         os.chdir(self.original_cwd)
-        import shutil
-
-        shutil.rmtree(self.tmpdir)
 
     def test_find_stale_worktrees_returns_empty_for_fresh_repo(self):
         """Should return empty list when no stale worktrees."""